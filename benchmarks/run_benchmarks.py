@@ -0,0 +1,166 @@
+"""Benchmark dataset generation throughput, memory and writer cost.
+
+Each (stage, size) case runs in a fresh spawned process so that peak RSS is
+measured per case. Results are saved as JSON and can be compared against a
+stored baseline:
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json --threshold 0.15
+
+With --baseline the run exits with status 1 when any case's rows/sec drops by
+more than the threshold fraction.
+"""
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+STAGES = ['generate', 'csv', 'parquet']
+SEED = 12345
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / (1 << 10)
+
+
+def _run_stage(stage, size, trace):
+    """Time one stage on size rows; writer stages are timed on an already generated frame"""
+    from dataset import create_india_network_dataset, write_columnar_chunks, write_csv_chunks
+
+    if trace:
+        tracemalloc.start()
+    if stage == 'generate':
+        start = time.perf_counter()
+        create_india_network_dataset(size, seed=SEED)
+        elapsed = time.perf_counter() - start
+    else:
+        df = create_india_network_dataset(size, seed=SEED)
+        out_dir = tempfile.mkdtemp(prefix='bench_')
+        try:
+            start = time.perf_counter()
+            if stage == 'csv':
+                write_csv_chunks([df], os.path.join(out_dir, 'out.csv'))
+            else:
+                write_columnar_chunks([df], os.path.join(out_dir, 'out'))
+            elapsed = time.perf_counter() - start
+        finally:
+            shutil.rmtree(out_dir)
+    traced_peak = None
+    if trace:
+        traced_peak = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        tracemalloc.stop()
+    return elapsed, traced_peak
+
+
+def _run_case(stage, size, repeat, trace):
+    """Process entry point: best of repeat timed runs, then (optionally) a separate tracemalloc run"""
+    elapsed = min(_run_stage(stage, size, trace=False)[0] for _ in range(repeat))
+    rss = _peak_rss_mb()
+    traced_peak = _run_stage(stage, size, trace=True)[1] if trace else None
+    return {
+        'stage': stage,
+        'rows': size,
+        'seconds': round(elapsed, 4),
+        'rows_per_sec': round(size / elapsed, 1),
+        'peak_rss_mb': round(rss, 1),
+        'tracemalloc_peak_mb': None if traced_peak is None else round(traced_peak, 1),
+    }
+
+
+def run_benchmarks(sizes, stages, repeat=3, trace=True):
+    """Run every (stage, size) case in its own spawned process and return the result records"""
+    ctx = multiprocessing.get_context('spawn')
+    results = []
+    for stage in stages:
+        for size in sizes:
+            with ctx.Pool(1) as pool:
+                result = pool.apply(_run_case, (stage, size, repeat, trace))
+            print(f"{stage:>9} {size:>11,} rows: {result['seconds']:8.3f} s  "
+                  f"{result['rows_per_sec']:>13,.0f} rows/s  peak RSS {result['peak_rss_mb']:.0f} MB")
+            results.append(result)
+    return results
+
+
+def _environment():
+    import numpy
+    import pandas
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """Return (stage, rows, baseline rows/s, current rows/s) for cases slower than baseline by > threshold"""
+    previous = {(r['stage'], r['rows']): r['rows_per_sec'] for r in baseline['results']}
+    regressions = []
+    for r in results:
+        before = previous.get((r['stage'], r['rows']))
+        if before and r['rows_per_sec'] < before * (1 - threshold):
+            regressions.append((r['stage'], r['rows'], before, r['rows_per_sec']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=lambda s: [int(x) for x in s.split(',')], default=DEFAULT_SIZES,
+                        help='comma-separated row counts (default: 10k,100k,1M,10M)')
+    parser.add_argument('--stages', type=lambda s: s.split(','), default=None,
+                        help=f"comma-separated stages out of {','.join(STAGES)} "
+                             f"(default: all; parquet only if pyarrow is installed)")
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case; the fastest is kept')
+    parser.add_argument('--no-tracemalloc', action='store_true', help='skip the tracemalloc allocation pass')
+    parser.add_argument('--output', help='write results JSON to this path')
+    parser.add_argument('--baseline', help='results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='allowed fractional throughput drop against the baseline (default: 0.15)')
+    args = parser.parse_args(argv)
+
+    if args.stages is None:
+        args.stages = [s for s in STAGES if s != 'parquet' or importlib.util.find_spec('pyarrow')]
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    report = {
+        'environment': _environment(),
+        'results': run_benchmarks(args.sizes, args.stages, args.repeat,
+                                  trace=not args.no_tracemalloc),
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report['results'], baseline, args.threshold)
+        for stage, rows, before, after in regressions:
+            print(f"REGRESSION {stage} {rows:,} rows: {before:,.0f} -> {after:,.0f} rows/s "
+                  f"({after / before - 1:+.1%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
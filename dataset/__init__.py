@@ -0,0 +1,56 @@
+"""Synthetic India mobile network performance dataset for the Power BI dashboard
+
+Importing the package does no work: the public API below is resolved from
+its submodule on first attribute access, so NumPy and pandas are only
+loaded once generation is actually used. Run ``python -m dataset --help``
+for the command line interface.
+"""
+import importlib
+
+_EXPORTS = {
+    'create_india_network_dataset': 'generator',
+    'iter_india_network_chunks': 'generator',
+    'iter_india_network_shards': 'generator',
+    'generate_india_network_parallel': 'generator',
+    'compile_lookup_tables': 'generator',
+    'create_india_network_sessions': 'sessions',
+    'iter_session_chunks': 'sessions',
+    'COMPACT_SCHEMA': 'schema',
+    'apply_compact_schema': 'schema',
+    'schema_memory_report': 'schema',
+    'write_csv_chunks': 'writers',
+    'write_india_network_csv': 'writers',
+    'write_columnar_chunks': 'writers',
+    'write_india_network_columnar': 'writers',
+    'write_sql_chunks': 'sqlstore',
+    'write_column_store': 'colstore',
+    'open_column_store': 'colstore',
+    'cached_india_network_dataset': 'cache',
+    'append_india_network_window': 'incremental',
+    'read_manifest': 'incremental',
+    'RollupCube': 'rollup',
+    'AggregateIndex': 'service',
+    'Profiler': 'profiling',
+    'ApproximateSummary': 'sketches',
+    'HyperLogLog': 'sketches',
+    'KLLSketch': 'sketches',
+    'CountMinSketch': 'sketches',
+    'SpaceSaving': 'sketches',
+    'StreamingSummary': 'summary',
+    'print_summary': 'summary',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Guarded: pool workers started with forkserver/spawn import this module as __mp_main__
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Content-addressed on-disk cache of generated datasets
+
+Entries are keyed by a hash of the generation parameters, the reference
+tables in ``dataset.data`` and the source of the generation code, so editing
+any of them invalidates old entries automatically. Each entry is a column
+store (see ``dataset.colstore``), so a hit memory-maps the column files
+without copying or decoding them: loading costs milliseconds whatever the
+entry size, and only the pages actually used are read. The directory is
+kept under a size budget by evicting the least recently used entries.
+"""
+import glob
+import hashlib
+import json
+import os
+import shutil
+
+import pandas as pd
+
+from . import data
+from .colstore import open_column_store, write_column_store
+from .generator import DEFAULT_NUM_SHARDS, generate_india_network_parallel, iter_india_network_shards
+
+DEFAULT_CACHE_DIR = os.environ.get('INDIA_NETWORK_CACHE_DIR',
+                                   os.path.join(os.path.expanduser('~'), '.cache', 'india_network_dataset'))
+DEFAULT_MAX_BYTES = 10 * 1024 ** 3
+_CODE_MODULES = ['generator.py', 'schema.py']
+
+
+def _fingerprint():
+    """Hash of the reference tables and the generation code"""
+    digest = hashlib.sha256()
+    tables = {name: value for name, value in vars(data).items() if name.isupper()}
+    digest.update(json.dumps(tables, sort_keys=True, default=repr).encode())
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for module in _CODE_MODULES:
+        with open(os.path.join(package_dir, module), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def cache_key(num_records, seed, end_time, num_shards=DEFAULT_NUM_SHARDS):
+    """Content address of a generated dataset"""
+    params = {'num_records': num_records, 'seed': seed, 'end_time': end_time.isoformat(),
+              'num_shards': num_shards, 'fingerprint': _fingerprint()}
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:32]
+
+
+ENTRY_SUFFIX = '.colstore'
+
+
+def _entry_size(path):
+    """Bytes used by one cache entry directory"""
+    size = 0
+    for name in os.listdir(path):
+        size += os.path.getsize(os.path.join(path, name))
+    return size
+
+
+def _evict(cache_dir, max_bytes, keep=None):
+    """Delete least recently used entries (other than keep) until the directory fits in max_bytes"""
+    entries = []
+    for path in glob.glob(os.path.join(cache_dir, '*' + ENTRY_SUFFIX)):
+        try:
+            entries.append((os.stat(path).st_mtime, _entry_size(path), path))
+        except FileNotFoundError:
+            continue
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+
+def cached_india_network_dataset(num_records, seed, end_time=None, num_shards=DEFAULT_NUM_SHARDS, workers=1,
+                                 cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+    """Generated dataset for (num_records, seed, end_time), loaded from the cache when possible
+
+    A seed is required, since only seeded output is reproducible.
+    end_time defaults to today's midnight, so an entry is reused all day.
+    On a miss the dataset is generated with iter_india_network_shards, stored
+    and then loaded through the same memory-mapped path. The returned frame
+    is copy-on-write: changing it never alters the cached entry.
+    """
+    if seed is None:
+        raise ValueError("caching needs a seed: unseeded output differs on every call")
+
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    end_time = pd.Timestamp.now().floor('D') if end_time is None else pd.Timestamp(end_time)
+    path = os.path.join(cache_dir, cache_key(num_records, seed, end_time, num_shards) + ENTRY_SUFFIX)
+
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        if num_records:
+            frames = iter_india_network_shards(num_records, seed, num_shards, workers, end_time)
+        else:
+            frames = [generate_india_network_parallel(0, seed, end_time=end_time)]
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            write_column_store(frames, tmp_path, overwrite=True)
+            try:
+                os.rename(tmp_path, path)
+            except OSError:
+                if not os.path.exists(path):
+                    raise  # otherwise another process stored the same entry first
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        _evict(cache_dir, max_bytes, keep=path)
+    else:
+        os.utime(path)  # mark as recently used
+
+    return open_column_store(path, mode='c')
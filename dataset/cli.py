@@ -0,0 +1,252 @@
+"""Command line entry point: ``python -m dataset``"""
+import argparse
+import contextlib
+import math
+import os
+
+DEFAULT_RECORDS = 30000
+DEFAULT_OUTPUT = 'india_network_data.csv'
+FORMATS = ['csv', 'parquet', 'feather', 'sqlite', 'duckdb', 'colstore']
+_EXTENSION_FORMATS = {'db': 'sqlite', 'sqlite3': 'sqlite'}
+
+
+def _infer_format(path):
+    """Output format from the file extension, defaulting to CSV"""
+    ext = path.rsplit('.', 1)[-1].lower() if '.' in path else ''
+    ext = _EXTENSION_FORMATS.get(ext, ext)
+    return ext if ext in FORMATS else 'csv'
+
+
+def build_parser():
+    # Defaults are duplicated here rather than imported so that --help does
+    # not pull in NumPy/pandas
+    parser = argparse.ArgumentParser(prog='python -m dataset',
+                                     description='Generate the India mobile network performance dataset.')
+    parser.add_argument('-n', '--rows', type=int, default=DEFAULT_RECORDS,
+                        help=f'number of records to generate (default: {DEFAULT_RECORDS})')
+    parser.add_argument('--seed', type=int, default=None, help='master seed for reproducible output')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT,
+                        help='output file (CSV, SQLite/DuckDB database) or directory (Parquet/Feather, '
+                             'memory-mapped column store) '
+                             f'(default: {DEFAULT_OUTPUT})')
+    parser.add_argument('-f', '--format', choices=FORMATS, default=None,
+                        help='output format (default: inferred from --output, else csv)')
+    parser.add_argument('--compression', default=None,
+                        help='codec: gzip or zstd for CSV, any pyarrow codec for Parquet/Feather '
+                             '(default: from a .gz/.zst extension for CSV, zstd otherwise)')
+    parser.add_argument('--chunk-size', type=int, default=500_000,
+                        help='rows generated and written per chunk (default: 500000)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='generator processes; 0 uses every core (default: 1)')
+    parser.add_argument('--writer-threads', type=int, default=2,
+                        help='threads encoding and compressing CSV chunks (default: 2)')
+    parser.add_argument('--prefetch', type=int, default=2,
+                        help='chunks generated ahead of the writer; 0 generates and writes in turn '
+                             '(default: 2)')
+    parser.add_argument('--shards', type=int, default=None,
+                        help='shards the rows are split into; with --seed, output depends only on '
+                             '(seed, rows, shards) (default: 32, or more so no shard exceeds --chunk-size)')
+    parser.add_argument('--end-time', default=None,
+                        help='timestamps fall in the year before this time; pin it for byte-identical '
+                             'reruns (default: now)')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='replace an existing output directory or database file')
+    parser.add_argument('--rollup', metavar='DIR', default=None,
+                        help='also write pre-aggregated rollup tables for the dashboard into DIR')
+    parser.add_argument('--rollup-dims', default='State,City,Carrier,Network_Type,Hour,Date',
+                        help='comma-separated rollup dimensions; Hour, Date and Weekday derive from '
+                             'Timestamp (default: State,City,Carrier,Network_Type,Hour,Date)')
+    parser.add_argument('--rollup-format', choices=['csv', 'parquet'], default='csv',
+                        help='rollup table format (default: csv)')
+    parser.add_argument('--append', metavar='DIR', default=None,
+                        help='append mode: add only the days since the last run to DIR (tracked in '
+                             'DIR/_manifest.json); --rows and --output are ignored')
+    parser.add_argument('--until', default=None,
+                        help='append mode: generate up to this date, exclusive (default: today)')
+    parser.add_argument('--rows-per-hour', type=int, default=None,
+                        help='append mode: rows generated per hour of the time axis (default: 100, '
+                             'then whatever the manifest records)')
+    parser.add_argument('--sketches', action='store_true',
+                        help='print approximate distinct counts, percentiles and top lists from '
+                             'fixed-memory sketches, with their error bounds')
+    parser.add_argument('--profile', action='store_true',
+                        help='print per-stage wall time of generation and writing')
+    parser.add_argument('--profile-output', metavar='FILE', default=None,
+                        help='write the stage profile to FILE: Prometheus text for .prom, JSON otherwise')
+    parser.add_argument('--trace-allocations', action='store_true',
+                        help='also record peak bytes allocated per stage (tracemalloc; slower, and implies '
+                             '--prefetch 0 --writer-threads 1 so stages do not overlap)')
+    parser.add_argument('--sessions', type=int, metavar='N', default=None,
+                        help='session mode: simulate N device sessions as Markov chains over network '
+                             'type, band and congestion, one row per 5-minute interval with Session_Id '
+                             'and Step (CSV only); --rows is ignored')
+    parser.add_argument('--summary', action='store_true',
+                        help='print dataset statistics, computed while the chunks stream past')
+    return parser
+
+
+def _append(args):
+    from .incremental import append_india_network_window
+
+    try:
+        entry = append_india_network_window(args.append, args.until, args.rows_per_hour, args.seed,
+                                            args.format, args.compression or 'zstd')
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    if entry is None:
+        print(f"✅ '{args.append}' is already up to date")
+    else:
+        print(f"✅ Appended {entry['rows']} records for {entry['start']} .. {entry['end']} "
+              f"to '{os.path.join(args.append, entry['file'])}'")
+    return 0
+
+
+def _write_output(chunks, file_format, args):
+    """Write the chunk stream in file_format to args.output; returns the row count written"""
+    try:
+        return _dispatch_output(chunks, file_format, args)
+    except FileExistsError:
+        raise SystemExit(f"{args.output} already exists; use --overwrite to replace it")
+
+
+def _dispatch_output(chunks, file_format, args):
+    if file_format == 'csv':
+        from .schema import COMPACT_SCHEMA
+        from .writers import write_csv_chunks
+
+        columns = list(COMPACT_SCHEMA)
+        if args.sessions is not None:
+            from .sessions import SESSION_COLUMNS
+
+            columns = SESSION_COLUMNS + columns
+        return write_csv_chunks(chunks, args.output, args.compression or 'infer', args.writer_threads, columns)
+
+    if file_format in ('sqlite', 'duckdb'):
+        from .sqlstore import write_sql_chunks
+
+        return write_sql_chunks(chunks, args.output, engine=file_format, overwrite=args.overwrite)
+
+    if file_format == 'colstore':
+        from .colstore import write_column_store
+
+        return write_column_store(chunks, args.output, overwrite=args.overwrite)
+
+    from .writers import write_columnar_chunks
+
+    return write_columnar_chunks(chunks, args.output, file_format=file_format,
+                                 compression=args.compression or 'zstd', overwrite=args.overwrite)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.rows < 0:
+        raise SystemExit('--rows must not be negative')
+    if args.chunk_size <= 0:
+        raise SystemExit('--chunk-size must be positive')
+    if args.writer_threads <= 0:
+        raise SystemExit('--writer-threads must be positive')
+    if args.sessions is not None and args.sessions < 0:
+        raise SystemExit('--sessions must not be negative')
+    if args.workers < 0:
+        raise SystemExit('--workers must not be negative')
+    if args.shards is not None and args.shards <= 0:
+        raise SystemExit('--shards must be positive')
+    if args.prefetch < 0:
+        raise SystemExit('--prefetch must not be negative')
+    if args.end_time is not None:
+        import pandas as pd
+
+        try:
+            end_time = pd.Timestamp(args.end_time)
+        except ValueError:
+            end_time = pd.NaT
+        if end_time is pd.NaT:
+            raise SystemExit(f'--end-time: cannot parse {args.end_time!r} as a time')
+        args.end_time = end_time
+
+    if args.trace_allocations:
+        # tracemalloc's peak is process-wide: stages overlapping on other threads would
+        # inflate (and reset) each other's numbers, so run the pipeline sequentially
+        args.prefetch, args.writer_threads = 0, 1
+
+    if args.append:
+        return _append(args)
+
+    from .generator import DEFAULT_NUM_SHARDS, iter_india_network_shards
+    from .pipeline import prefetch_chunks
+
+    file_format = args.format or _infer_format(args.output)
+    if file_format == 'csv' and args.compression not in (None, 'gzip', 'zstd'):
+        raise SystemExit('--compression must be gzip or zstd for CSV output')
+    if args.sessions is not None and file_format != 'csv':
+        raise SystemExit('session mode writes CSV only: the other formats have no Session_Id/Step columns')
+    shards = args.shards
+    if shards is None:
+        shards = max(DEFAULT_NUM_SHARDS, math.ceil(args.rows / args.chunk_size))
+    workers = args.workers or None
+
+    from .data import INDIAN_LOCATIONS, STATE_NAMES
+
+    print(f"📍 Total locations loaded: {len(INDIAN_LOCATIONS)}")
+    print(f"🗺️ States/UTs covered: {len(STATE_NAMES)}")
+    print("🇮🇳 Generating India network performance dataset...")
+    # Generation (and the summary/rollup folds below) run ahead of the writer on a background thread
+    if args.sessions is not None:
+        from .sessions import iter_session_chunks
+
+        chunks = iter_session_chunks(args.sessions, args.seed, end_time=args.end_time)
+    else:
+        chunks = iter_india_network_shards(args.rows, args.seed, shards, workers, args.end_time)
+    summary = None
+    if args.summary:
+        from .summary import StreamingSummary
+
+        summary = StreamingSummary()
+        chunks = summary.observe(chunks)
+
+    cube = None
+    if args.rollup:
+        from .rollup import RollupCube
+
+        try:
+            cube = RollupCube(args.rollup_dims.split(','))
+        except ValueError as exc:
+            raise SystemExit(str(exc))
+        chunks = cube.observe(chunks)
+
+    sketches = None
+    if args.sketches:
+        from .sketches import ApproximateSummary
+
+        sketches = ApproximateSummary(seed=args.seed)
+        chunks = sketches.observe(chunks)
+    chunks = prefetch_chunks(chunks, args.prefetch)
+
+    profiler = None
+    if args.profile or args.profile_output:
+        from .profiling import Profiler
+
+        profiler = Profiler(trace_allocations=args.trace_allocations)
+    with profiler or contextlib.nullcontext():
+        written = _write_output(chunks, file_format, args)
+
+    print(f"\n✅ India network dataset created: '{args.output}' ({written} records, {file_format})")
+    if cube is not None:
+        cells = cube.write(args.rollup, args.rollup_format)
+        print(f"🧊 Rollup tables written to '{args.rollup}' ({cells} cells)")
+    if summary is not None:
+        from .summary import print_summary
+
+        print_summary(summary)
+        print("\n✨ Dataset generation complete!")
+    if sketches is not None:
+        from .sketches import print_approximate_summary
+
+        print_approximate_summary(sketches)
+    if profiler is not None:
+        if args.profile:
+            profiler.report()
+        if args.profile_output:
+            profiler.write(args.profile_output)
+            print(f"⏱️ Stage profile written to '{args.profile_output}'")
+    return 0
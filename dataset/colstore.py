@@ -0,0 +1,114 @@
+"""Memory-mapped column store for instant, zero-copy reloads
+
+A store is a directory with one raw little-endian NumPy file per column
+(``<column>.bin``, written with ``ndarray.tofile``) and a JSON header
+(HEADER_NAME) recording the row count and, per column, its file, dtype
+and, for string dimensions, the category dictionary. Categorical columns
+are stored as their integer codes. The header is written last, so a store
+whose write was interrupted has no header and is refused by the reader.
+
+open_column_store maps the files with ``np.memmap`` and wraps them in a
+DataFrame without copying: opening is instant whatever the row count, and
+only the pages of the columns actually used are ever read from disk.
+"""
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .profiling import stage
+from .schema import COMPACT_SCHEMA, apply_compact_schema
+
+HEADER_NAME = 'header.json'
+FORMAT_NAME = 'india-network-colstore'
+FORMAT_VERSION = 1
+
+
+def _storage_dtype(dtype):
+    """On-disk dtype of a COMPACT_SCHEMA column: category codes or the column's own dtype"""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pd.Categorical.from_codes([], dtype=dtype).codes.dtype
+    return dtype
+
+
+def write_column_store(chunks, directory, overwrite=False):
+    """Stream DataFrame chunks into a column store directory; returns the row count written"""
+    if os.path.exists(directory) and os.listdir(directory):
+        if not overwrite:
+            raise FileExistsError(f"{directory} is not empty; pass overwrite=True to replace it")
+        shutil.rmtree(directory)
+    os.makedirs(directory, exist_ok=True)
+
+    columns = []
+    for column, dtype in COMPACT_SCHEMA.items():
+        entry = {'name': column, 'file': f'{column}.bin', 'dtype': _storage_dtype(dtype).newbyteorder('<').str}
+        if isinstance(dtype, pd.CategoricalDtype):
+            entry['categories'] = list(dtype.categories)
+        columns.append(entry)
+
+    files = [open(os.path.join(directory, entry['file']), 'wb') for entry in columns]
+    written = 0
+    try:
+        for chunk in chunks:
+            with stage('colstore_write', len(chunk)):
+                chunk = apply_compact_schema(chunk)
+                for entry, f in zip(columns, files):
+                    values = chunk[entry['name']]
+                    values = values.cat.codes.to_numpy() if 'categories' in entry else values.to_numpy()
+                    np.ascontiguousarray(values, dtype=entry['dtype']).tofile(f)
+            written += len(chunk)
+    finally:
+        for f in files:
+            f.close()
+
+    header = {'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'rows': written, 'columns': columns}
+    with open(os.path.join(directory, HEADER_NAME), 'w', encoding='utf-8') as f:
+        json.dump(header, f, indent=2)
+    return written
+
+
+def read_column_store_header(directory):
+    """The parsed JSON header of a column store"""
+    path = os.path.join(directory, HEADER_NAME)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{directory} has no {HEADER_NAME}; it is not a (complete) column store")
+    with open(path, encoding='utf-8') as f:
+        header = json.load(f)
+    if header.get('format') != FORMAT_NAME or header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} {FORMAT_NAME} header")
+    return header
+
+
+def open_column_store(directory, columns=None, mode='r'):
+    """Memory-map a column store as a DataFrame without copying
+
+    columns selects a subset (default: all, in stored order); unselected
+    columns are not even opened. With mode='r' the frame is read-only; with
+    mode='c' it is writable copy-on-write: modified pages are private to this
+    process and never written back to the store.
+    """
+    if mode not in ('r', 'c'):
+        raise ValueError(f"mode must be 'r' or 'c', got {mode!r}")
+    header = read_column_store_header(directory)
+    entries = {entry['name']: entry for entry in header['columns']}
+    names = list(entries) if columns is None else list(columns)
+    unknown = [name for name in names if name not in entries]
+    if unknown:
+        raise KeyError(f"columns not in the store: {unknown}")
+
+    rows = header['rows']
+    data = {}
+    for name in names:
+        entry = entries[name]
+        dtype = np.dtype(entry['dtype'])
+        if rows:
+            values = np.memmap(os.path.join(directory, entry['file']), dtype=dtype, mode=mode, shape=(rows,))
+        else:
+            values = np.empty(0, dtype=dtype)  # mmap cannot map an empty file
+        if 'categories' in entry:
+            values = pd.Categorical.from_codes(values, dtype=pd.CategoricalDtype(entry['categories']),
+                                               validate=False)
+        data[name] = values
+    return pd.DataFrame(data, copy=False)
@@ -0,0 +1,417 @@
+"""Vectorized batch engine that generates the dataset as NumPy columns"""
+import multiprocessing
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import pandas as pd
+import numpy as np
+
+from .data import (BAND_PROBS_4G, BAND_PROBS_5G, BANDS_3G, BANDS_4G, BANDS_5G, BUDGET_DEVICE_MARKERS,
+                   CARRIER_WEIGHTS, CITY_NAMES, CONGESTION_LEVELS, CONGESTION_PROBS, HOURLY_TRAFFIC_PROFILE,
+                   INDIAN_BANDS, INDIAN_CARRIERS, INDIAN_DEVICES, INDIAN_LOCATIONS, INDOOR_OUTDOOR_PROBS,
+                   NETWORK_MULTIPLIERS, NETWORK_TYPE_PROBS, NETWORK_TYPES, NIGHT_HOURS, PEAK_HOURS,
+                   PREMIUM_DEVICE_MARKERS, STATE_NAMES, VIDEO_QUALITIES, VIDEO_QUALITY_PROBS,
+                   WEEKDAY_TRAFFIC_PROFILE)
+from .profiling import Profiler, active_profiler, stage_clock
+from .schema import COMPACT_SCHEMA, weekday_of_days
+
+
+# Device capability tiers
+DEVICE_STANDARD, DEVICE_PREMIUM, DEVICE_BUDGET = 0, 1, 2
+
+LookupTables = namedtuple('LookupTables', [
+    'city_codes', 'state_codes', 'tiers',           # per location
+    'download_base', 'upload_base', 'latency_base',
+    'network_bucket',                               # per location: row of network_type_cdf
+    'network_type_cdf',                             # per penetration bucket x network type
+    'network_multipliers',                          # per network type: (download, upload, latency)
+    'device_tier',                                  # per device: DEVICE_* code
+    'band_cdf',                                     # per network type x INDIAN_BANDS
+    'hour_weights',                                 # per weekday * 24 + hour: traffic density
+    'peak_hours', 'night_hours',                    # per hour of day: bool
+])
+
+
+def _device_tier(device):
+    """Capability tier of a device model, from substring markers in its name"""
+    if any(x in device for x in PREMIUM_DEVICE_MARKERS):
+        return DEVICE_PREMIUM
+    if any(x in device for x in BUDGET_DEVICE_MARKERS):
+        return DEVICE_BUDGET
+    return DEVICE_STANDARD
+
+
+def _band_probs(network_type):
+    """Probability of each INDIAN_BANDS entry for one network type"""
+    if network_type == '5G':
+        bands, probs = BANDS_5G, BAND_PROBS_5G
+    elif network_type in ['4G+', '4G']:
+        bands, probs = BANDS_4G, BAND_PROBS_4G
+    else:
+        bands, probs = BANDS_3G, [1 / len(BANDS_3G)] * len(BANDS_3G)
+    row = np.zeros(len(INDIAN_BANDS))
+    row[[INDIAN_BANDS.index(b) for b in bands]] = probs
+    return row
+
+
+def cumulative_probs(probs):
+    """Row-wise cumulative probabilities, pinned to exactly 1.0 once a row's mass is used up"""
+    cdf = np.cumsum(probs, axis=1)
+    cdf[cdf > 1 - 1e-9] = 1.0
+    return cdf
+
+
+def _hour_weights():
+    """Traffic density of each hour of the week (weekday * 24 + hour) from the two profiles"""
+    hourly = np.asarray(HOURLY_TRAFFIC_PROFILE, dtype=float)
+    weekday = np.asarray(WEEKDAY_TRAFFIC_PROFILE, dtype=float)
+    if hourly.shape != (24,) or weekday.shape != (7,):
+        raise ValueError("the hourly and weekday traffic profiles need 24 and 7 entries")
+    if (hourly < 0).any() or (weekday < 0).any() or hourly.sum() == 0 or weekday.sum() == 0:
+        raise ValueError("traffic profiles must be non-negative with some positive entries")
+    return np.outer(weekday, hourly).ravel()
+
+
+def _hour_mask(hours):
+    mask = np.zeros(24, dtype=bool)
+    mask[hours] = True
+    return mask
+
+
+@lru_cache(maxsize=None)
+def compile_lookup_tables():
+    """Compile the location, device, multiplier and band tables into NumPy lookup arrays
+
+    Generation then reduces to index lookups. The result is cached per
+    process and is cheap to pickle, so pool workers can share it.
+    """
+    penetration = np.array([loc['5g_penetration'] for loc in INDIAN_LOCATIONS])
+    tables = LookupTables(
+        city_codes=np.array([CITY_NAMES.index(loc['city']) for loc in INDIAN_LOCATIONS], dtype=np.int16),
+        state_codes=np.array([STATE_NAMES.index(loc['state']) for loc in INDIAN_LOCATIONS], dtype=np.int8),
+        tiers=np.array([loc['tier'] for loc in INDIAN_LOCATIONS], dtype=np.int8),
+        download_base=np.array([loc['download_base'] for loc in INDIAN_LOCATIONS], dtype=float),
+        upload_base=np.array([loc['upload_base'] for loc in INDIAN_LOCATIONS], dtype=float),
+        latency_base=np.array([loc['latency_base'] for loc in INDIAN_LOCATIONS], dtype=float),
+        network_bucket=np.where(penetration > 0.30, 0, np.where(penetration > 0.15, 1, 2)).astype(np.int8),
+        network_type_cdf=cumulative_probs(NETWORK_TYPE_PROBS),
+        network_multipliers=np.array([NETWORK_MULTIPLIERS[t] for t in NETWORK_TYPES]),
+        device_tier=np.array([_device_tier(d) for d in INDIAN_DEVICES], dtype=np.int8),
+        band_cdf=cumulative_probs([_band_probs(t) for t in NETWORK_TYPES]),
+        hour_weights=_hour_weights(),
+        peak_hours=_hour_mask(PEAK_HOURS),
+        night_hours=_hour_mask(NIGHT_HOURS),
+    )
+    for array in tables:
+        array.flags.writeable = False
+    return tables
+
+
+def choice_per_row(rng, cdf, rows):
+    """Draw one category index per row, each row using its own cumulative probability vector"""
+    u = rng.random(len(rows))
+    return (u[:, None] >= cdf[rows]).sum(axis=1)
+
+
+def _scale_where(rng, values, mask, low, high):
+    """Multiply the masked entries in place by independent uniform(low, high) factors"""
+    values[mask] *= rng.uniform(low, high, np.count_nonzero(mask))
+
+
+_SECONDS_PER_HOUR = 3600
+
+
+def _slot_weights(tables, first_hour, count):
+    """Traffic density of count consecutive hours, first_hour counted in hours since the Unix epoch"""
+    hours = first_hour + np.arange(count)
+    weekday = weekday_of_days(hours // 24)
+    return tables.hour_weights[weekday * 24 + hours % 24]
+
+
+def _draw_slots(rng, weights, n):
+    """n slot indices drawn with probability proportional to weights"""
+    cdf = np.cumsum(weights)
+    if cdf[-1] <= 0:
+        raise ValueError("the traffic profile gives the requested time window zero density")
+    # side='right' never lands on a zero-weight slot
+    return np.searchsorted(cdf, rng.random(n) * cdf[-1], side='right')
+
+
+def generate_timestamps(rng, n, tables, end_time, start_time=None):
+    """n timestamps as a datetime64[us] array, distributed by the hourly and weekday traffic profile
+
+    Without start_time they fall on the hour steps of the year before
+    end_time; with it, on whole seconds in [start_time, end_time).
+    """
+    end = end_time.to_datetime64().astype('datetime64[us]')
+    if start_time is None:
+        end_hour = end.astype('datetime64[h]').astype(np.int64)
+        steps = 8759 - _draw_slots(rng, _slot_weights(tables, end_hour - 8759, 8760), n)
+        return end - steps * np.timedelta64(_SECONDS_PER_HOUR, 's')
+
+    start = pd.Timestamp(start_time).to_datetime64().astype('datetime64[s]').astype(np.int64)
+    end = end.astype('datetime64[s]').astype(np.int64)
+    if end <= start:
+        raise ValueError(f"end_time {end_time} must be after start_time {start_time}")
+    # Hour slots overlapping the window, each weighted by density x covered seconds
+    first_hour, last_hour = start // _SECONDS_PER_HOUR, -(-end // _SECONDS_PER_HOUR)
+    slot_start = np.arange(first_hour, last_hour) * _SECONDS_PER_HOUR
+    low = np.maximum(slot_start, start)
+    high = np.minimum(slot_start + _SECONDS_PER_HOUR, end)
+    slots = _draw_slots(rng, _slot_weights(tables, first_hour, len(low)) * (high - low), n)
+    seconds = low[slots] + (rng.random(n) * (high - low)[slots]).astype(np.int64)
+    return seconds.astype('datetime64[s]').astype('datetime64[us]')
+
+
+def generate_batch(n, rng, end_time=None, start_time=None):
+    """Generate n records as a DataFrame, one NumPy array per column
+
+    All randomness comes from the ``numpy.random.Generator`` rng. Timestamps
+    are drawn first, from the traffic profile, over the hour steps of the
+    year before end_time (default: now) or, when start_time is given, over
+    whole seconds in [start_time, end_time). The peak and night-time
+    adjustments follow each row's timestamp hour.
+    """
+    tables = compile_lookup_tables()
+    clock = stage_clock(n)
+
+    end_time = pd.Timestamp.now() if end_time is None else pd.Timestamp(end_time)
+    timestamps = generate_timestamps(rng, n, tables, end_time, start_time)
+    clock.lap('timestamps')
+
+    # Select locations
+    loc_idx = rng.integers(0, len(INDIAN_LOCATIONS), n)
+
+    # Network type distribution based on 5G penetration
+    net_idx = choice_per_row(rng, tables.network_type_cdf, tables.network_bucket[loc_idx])
+
+    # Carrier selection
+    carrier_idx = rng.choice(len(INDIAN_CARRIERS), size=n, p=CARRIER_WEIGHTS)
+    clock.lap('locations')
+
+    return generate_records(rng, tables, clock, timestamps, loc_idx, net_idx, carrier_idx)
+
+
+def generate_records(rng, tables, clock, timestamps, loc_idx, net_idx, carrier_idx, device_idx=None,
+                     band_idx=None, congestion_idx=None, load=None):
+    """The measurement columns for given times, locations, network types and carriers, as a DataFrame
+
+    device_idx, band_idx and congestion_idx are drawn independently per row
+    unless given. load is an optional (n, 3) array of download, upload and
+    latency multipliers applied along with the time-of-day adjustments.
+    """
+    n = len(timestamps)
+    hour = timestamps.astype('datetime64[h]').astype(np.int64) % 24
+
+    # Base performance scaled by network type
+    mult_dl, mult_ul, mult_lat = tables.network_multipliers[net_idx].T
+
+    # Apply variations with realistic distribution
+    download_speed = np.maximum(0.5, rng.lognormal(np.log(tables.download_base[loc_idx] * mult_dl), 0.6))
+    upload_speed = np.maximum(0.2, rng.lognormal(np.log(tables.upload_base[loc_idx] * mult_ul), 0.65))
+    latency = np.maximum(10, rng.lognormal(np.log(tables.latency_base[loc_idx] * mult_lat), 0.5))
+    clock.lap('performance_model')
+
+    # Signal strength (India has more variation)
+    signal_strength = rng.normal(-85, 18, n)
+    signal_factor = np.clip((signal_strength + 110) / 40, 0.1, 1.3)
+
+    download_speed *= signal_factor
+    upload_speed *= signal_factor
+    latency /= (signal_factor * 0.8)  # Less impact on latency
+    clock.lap('signal')
+
+    # Time-based variations (Indian context), by the hour of the row's timestamp
+    peak = tables.peak_hours[hour]
+    night = tables.night_hours[hour]
+    _scale_where(rng, download_speed, peak, 0.4, 0.7)
+    _scale_where(rng, upload_speed, peak, 0.35, 0.65)
+    _scale_where(rng, latency, peak, 1.3, 2.0)
+    _scale_where(rng, download_speed, night, 1.2, 1.6)
+    _scale_where(rng, upload_speed, night, 1.1, 1.5)
+    _scale_where(rng, latency, night, 0.7, 0.9)
+    if load is not None:
+        download_speed *= load[:, 0]
+        upload_speed *= load[:, 1]
+        latency *= load[:, 2]
+    clock.lap('time_of_day')
+
+    # Jitter calculation
+    base_jitter = latency * rng.uniform(0.08, 0.20, n)
+    jitter = np.maximum(0.5, rng.exponential(base_jitter))
+    clock.lap('jitter')
+
+    # Device selection and capability
+    if device_idx is None:
+        device_idx = rng.integers(0, len(INDIAN_DEVICES), n)
+    device_tier = tables.device_tier[device_idx]
+    premium = device_tier == DEVICE_PREMIUM
+    budget = device_tier == DEVICE_BUDGET
+    _scale_where(rng, download_speed, premium, 1.05, 1.12)
+    _scale_where(rng, upload_speed, premium, 1.03, 1.10)
+    _scale_where(rng, latency, premium, 0.93, 0.98)
+    _scale_where(rng, download_speed, budget, 0.80, 0.90)
+    _scale_where(rng, upload_speed, budget, 0.75, 0.88)
+    _scale_where(rng, latency, budget, 1.08, 1.18)
+    clock.lap('devices')
+
+    # Band selection based on network type
+    if band_idx is None:
+        band_idx = choice_per_row(rng, tables.band_cdf, net_idx)
+    clock.lap('bands')
+
+    def categorical(column, codes):
+        return pd.Categorical.from_codes(codes, dtype=COMPACT_SCHEMA[column])
+
+    def measurement(values, decimals):
+        return np.round(values, decimals).astype(np.float32)
+
+    frame = pd.DataFrame({
+        'Timestamp': timestamps,
+        'City': categorical('City', tables.city_codes[loc_idx]),
+        'State': categorical('State', tables.state_codes[loc_idx]),
+        'City_Tier': tables.tiers[loc_idx],
+        'Signal_Strength_dBm': measurement(signal_strength, 1),
+        'Download_Speed_Mbps': measurement(np.maximum(0.1, download_speed), 2),
+        'Upload_Speed_Mbps': measurement(np.maximum(0.1, upload_speed), 2),
+        'Latency_ms': measurement(np.maximum(5, latency), 1),
+        'Jitter_ms': measurement(np.maximum(0.2, jitter), 2),
+        'Network_Type': categorical('Network_Type', net_idx),
+        'Device_Model': categorical('Device_Model', device_idx),
+        'Carrier': categorical('Carrier', carrier_idx),
+        'Band': categorical('Band', band_idx),
+        'Battery_Level_%': rng.integers(10, 100, n, dtype=np.int8),
+        'Temperature_C': measurement(rng.normal(35, 8, n), 1),  # Indian climate
+        'Connected_Duration_min': measurement(rng.exponential(45, n), 1),
+        'Handover_Count': rng.poisson(3, n).astype(np.int16),
+        'Data_Usage_MB': measurement(rng.exponential(350, n), 1),
+        'Video_Streaming_Quality': categorical(
+            'Video_Streaming_Quality', rng.choice(len(VIDEO_QUALITIES), size=n, p=VIDEO_QUALITY_PROBS)),
+        'VoLTE_Enabled': rng.random(n) < 0.85,
+        'Network_Congestion_Level': categorical(
+            'Network_Congestion_Level',
+            rng.choice(len(CONGESTION_LEVELS), size=n, p=CONGESTION_PROBS) if congestion_idx is None
+            else congestion_idx),
+        'Ping_to_Server_ms': measurement(np.maximum(15, latency + rng.exponential(8, n)), 1),
+        'Packet_Loss_%': measurement(rng.exponential(0.8, n), 2),
+        'Dropped_Connection': rng.random(n) < 0.08,
+        'Indoor_Outdoor': categorical('Indoor_Outdoor', (rng.random(n) >= INDOOR_OUTDOOR_PROBS[0]).astype(np.int8))
+    })
+    clock.lap('frame')
+    return frame
+
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+# Fixed so that sharded output depends on the seed alone, not on the machine
+DEFAULT_NUM_SHARDS = 32
+
+
+def create_india_network_dataset(num_records=10000, seed=None):
+    """Create a realistic India-focused mobile network performance dataset with comprehensive coverage
+
+    Every column is produced as a whole NumPy array in one pass; the
+    distributions match the original per-row model.
+    """
+    return generate_batch(num_records, np.random.default_rng(seed))
+
+
+def iter_india_network_chunks(num_records, chunk_size=DEFAULT_CHUNK_SIZE, seed=None):
+    """Yield the dataset as DataFrame chunks of at most chunk_size rows
+
+    Only one chunk is alive at a time, so memory stays flat however large
+    num_records is.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    rng = np.random.default_rng(seed)
+    end_time = pd.Timestamp.now()
+    remaining = num_records
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        yield generate_batch(n, rng, end_time)
+        remaining -= n
+
+
+def _shard_sizes(num_records, num_shards):
+    """Split num_records into num_shards near-equal, deterministic shard sizes"""
+    base, extra = divmod(num_records, num_shards)
+    return [base + (1 if i < extra else 0) for i in range(num_shards)]
+
+
+_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def _generate_shard(args):
+    """Process pool entry point: generate one shard from its own SeedSequence
+
+    Returns (frame, stage events). When profile is set the shard runs under
+    its own Profiler (tracing allocations if profile == 'allocations') and
+    its events are handed back for the parent's Profiler to record.
+    """
+    n, seed_seq, end_time, profile = args
+    if not profile:
+        return generate_batch(n, np.random.default_rng(seed_seq), end_time), []
+    events = []
+    with Profiler(hooks=[events.append], trace_allocations=profile == 'allocations'):
+        frame = generate_batch(n, np.random.default_rng(seed_seq), end_time)
+    return frame, events
+
+
+def iter_india_network_shards(num_records, seed=None, num_shards=DEFAULT_NUM_SHARDS,
+                              workers=None, end_time=None):
+    """Generate the dataset in parallel shards, yielding them in shard order
+
+    Each shard draws from an independent Generator spawned from one master
+    SeedSequence, so for a given seed, num_shards and end_time the output is
+    identical whatever the number of worker processes.
+    """
+    if num_shards <= 0:
+        raise ValueError(f"num_shards must be positive, got {num_shards}")
+    end_time = pd.Timestamp.now() if end_time is None else pd.Timestamp(end_time)
+    seed_seqs = np.random.SeedSequence(seed).spawn(num_shards)
+    sizes = _shard_sizes(num_records, num_shards)
+
+    if workers == 1:
+        for n, ss in zip(sizes, seed_seqs):
+            if n > 0:
+                yield generate_batch(n, np.random.default_rng(ss), end_time)
+        return
+
+    # Pool workers cannot see this process's Profiler, so they profile themselves
+    profiler = active_profiler()
+    profile = profiler and ('allocations' if profiler.trace_allocations else 'time')
+    tasks = [(n, ss, end_time, profile) for n, ss in zip(sizes, seed_seqs) if n > 0]
+
+    def collect(future):
+        frame, events = future.result()
+        for event in events:
+            profiler.record(event)
+        return frame
+
+    workers = workers or os.cpu_count() or 1
+    # Not fork: the pool may be started from a producer thread while writer threads hold locks
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(_START_METHOD))
+    try:
+        # Bound the shards in flight so memory stays flat for large runs
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_generate_shard, task))
+            if len(pending) >= 2 * workers:
+                yield collect(pending.popleft())
+        while pending:
+            yield collect(pending.popleft())
+    finally:
+        # Also reached when the consumer closes the generator early: drop the queued shards
+        executor.shutdown(cancel_futures=True)
+
+
+def generate_india_network_parallel(num_records, seed=None, num_shards=DEFAULT_NUM_SHARDS,
+                                    workers=None, end_time=None):
+    """Generate the whole dataset across a process pool and return it as one DataFrame"""
+    shards = list(iter_india_network_shards(num_records, seed, num_shards, workers, end_time))
+    if not shards:
+        return generate_batch(0, np.random.default_rng(seed), end_time)
+    return pd.concat(shards, ignore_index=True)
@@ -0,0 +1,107 @@
+"""Incremental append mode on a fixed time axis
+
+The data for each calendar day is a pure function of (seed, day number since
+EPOCH), so the dataset is the same whatever the refresh cadence. A small
+manifest in the output directory records the parameters and the high-water
+mark; each run generates only the whole days between the high-water mark and
+`until`, sorts them by Timestamp and writes them as one new file (CSV) or
+directory (Parquet/Feather), so downstream incremental refresh picks up only
+the new rows.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .generator import generate_batch
+
+EPOCH = pd.Timestamp('2024-01-01')
+DEFAULT_ROWS_PER_HOUR = 100
+# Leading underscore: Arrow dataset readers skip it when scanning the directory
+MANIFEST_NAME = '_manifest.json'
+
+
+def read_manifest(directory):
+    """The manifest of an append-mode dataset directory, or None if there is none yet"""
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_manifest(directory, manifest):
+    """Replace the manifest atomically so a crashed run never leaves it half written"""
+    path = os.path.join(directory, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _day_frame(day, seed, rows_per_day):
+    """All rows of one day (day number since EPOCH), sorted by Timestamp"""
+    rng = np.random.default_rng(np.random.SeedSequence([seed, day]))
+    start = EPOCH + pd.Timedelta(days=day)
+    frame = generate_batch(rows_per_day, rng, end_time=start + pd.Timedelta(days=1), start_time=start)
+    return frame.sort_values('Timestamp', kind='stable', ignore_index=True)
+
+
+def _check_option(manifest, key, value):
+    """Refuse to change an option once the manifest records it; None means keep it"""
+    if value is not None and value != manifest[key]:
+        raise ValueError(f"{key}={value!r} does not match {manifest[key]!r} recorded in the manifest")
+
+
+def append_india_network_window(directory, until=None, rows_per_hour=None, seed=None, file_format=None,
+                                compression='zstd'):
+    """Generate the days between the manifest's high-water mark and until into a new file
+
+    until defaults to now and is rounded down to midnight, so only complete
+    days are written. The first run starts at EPOCH; seed, rows_per_hour and
+    file_format are fixed by it and recorded in the manifest. Returns the
+    manifest entry of the new file, or None when there was nothing to add.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = read_manifest(directory)
+    if manifest is None:
+        manifest = {
+            'epoch': EPOCH.isoformat(),
+            'seed': int(np.random.SeedSequence().entropy) if seed is None else seed,
+            'rows_per_hour': rows_per_hour or DEFAULT_ROWS_PER_HOUR,
+            'file_format': file_format or 'csv',
+            'high_water_mark': EPOCH.isoformat(),
+            'files': [],
+        }
+    else:
+        _check_option(manifest, 'seed', seed)
+        _check_option(manifest, 'rows_per_hour', rows_per_hour)
+        _check_option(manifest, 'file_format', file_format)
+
+    high_water_mark = pd.Timestamp(manifest['high_water_mark'])
+    until = (pd.Timestamp.now() if until is None else pd.Timestamp(until)).floor('D')
+    first_day = (high_water_mark - EPOCH).days
+    last_day = (until - EPOCH).days
+    if last_day <= first_day:
+        return None
+
+    rows_per_day = manifest['rows_per_hour'] * 24
+    days = (_day_frame(day, manifest['seed'], rows_per_day) for day in range(first_day, last_day))
+    name = f"part-{high_water_mark:%Y%m%d}-{until:%Y%m%d}"
+    if manifest['file_format'] == 'csv':
+        from .writers import write_csv_chunks
+
+        name += '.csv'
+        written = write_csv_chunks(days, os.path.join(directory, name))
+    else:
+        from .writers import write_columnar_chunks
+
+        written = write_columnar_chunks(days, os.path.join(directory, name), file_format=manifest['file_format'],
+                                        compression=compression, partition_by=(), overwrite=True)
+
+    entry = {'file': name, 'start': high_water_mark.isoformat(), 'end': until.isoformat(), 'rows': written}
+    manifest['files'].append(entry)
+    manifest['high_water_mark'] = until.isoformat()
+    _write_manifest(directory, manifest)
+    return entry
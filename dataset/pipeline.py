@@ -0,0 +1,92 @@
+"""Producer/consumer plumbing that overlaps chunk generation with serialization and writing
+
+prefetch_chunks runs the chunk producer on a background thread and hands
+chunks over through a bounded queue, so generation of the next chunk
+proceeds while the current one is being written and a slow writer holds the
+producer back instead of letting chunks pile up in memory. ordered_map
+applies a function (e.g. CSV encoding plus compression) on a thread pool
+with a bounded number of chunks in flight and yields results in input order.
+NumPy, zlib and the Arrow codecs release the GIL, so the stages genuinely
+run side by side; the end-to-end time approaches the slowest stage rather
+than the sum of all of them.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PREFETCH = 2
+
+_DONE = object()
+
+
+def prefetch_chunks(chunks, max_pending=DEFAULT_PREFETCH):
+    """Yield the items of chunks, produced up to max_pending ahead on a background thread
+
+    Exceptions raised by the producer are re-raised in the consumer. If the
+    consumer stops early the producer is told to stop after its current item
+    and chunks is closed.
+    """
+    if max_pending <= 0:
+        yield from chunks
+        return
+
+    pending = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(_DONE)
+        except BaseException as exc:
+            put(exc)
+        finally:
+            # Release the source's resources (e.g. a process pool) now, not at garbage collection
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, name='chunk-producer', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pending.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def ordered_map(func, items, threads=1):
+    """Yield func(item) for each item in order, computed on up to threads worker threads
+
+    At most 2 x threads items are in flight, so a slow consumer throttles
+    how far ahead items are taken from the input.
+    """
+    if threads <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    in_flight = []
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for item in items:
+            in_flight.append(pool.submit(func, item))
+            if len(in_flight) >= 2 * threads:
+                yield in_flight.pop(0).result()
+        for future in in_flight:
+            yield future.result()
@@ -0,0 +1,192 @@
+"""Per-stage profiling of generation and writing
+
+Instrumented code marks its stages with stage_clock(rows).lap(name) or the
+stage(name, rows) context manager. Both are no-ops unless a Profiler is
+active (``with Profiler(): ...``), so the hooks cost nothing in normal runs.
+Each finished stage becomes a StageEvent that the Profiler totals per
+stage and passes to its hooks, e.g. to stream metrics elsewhere. With
+trace_allocations the event also carries the peak bytes allocated by the
+stage, measured with tracemalloc (NumPy reports its buffers to it). The
+tracemalloc peak is process-wide, so allocation numbers are only
+meaningful when stages do not overlap on several threads; the CLI runs
+the pipeline sequentially when tracing.
+
+Stages that run in pool processes are recorded by a Profiler inside the
+worker and replayed into the parent's; stages that run on writer threads
+overlap in time, so their seconds can add up to more than the wall time.
+"""
+import json
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+import pandas as pd
+
+StageEvent = namedtuple('StageEvent', ['stage', 'seconds', 'rows', 'allocated_bytes'])
+
+PROMETHEUS_PREFIX = 'india_network'
+
+_active = None
+
+
+def active_profiler():
+    """The Profiler currently collecting stage events, or None"""
+    return _active
+
+
+class _NullClock:
+    def lap(self, stage):
+        pass
+
+
+_NULL_CLOCK = _NullClock()
+
+
+class _StageClock:
+    """Times consecutive stages: each lap() closes the stage that started at the previous lap"""
+
+    def __init__(self, profiler, rows):
+        self.profiler = profiler
+        self.rows = rows
+        self._tracing = profiler.trace_allocations and tracemalloc.is_tracing()
+        self._start_memory = self._reset_memory()
+        self._start = time.perf_counter()
+
+    def _reset_memory(self):
+        if not self._tracing:
+            return 0
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        allocated = tracemalloc.get_traced_memory()[1] - self._start_memory if self._tracing else 0
+        self.profiler.record(StageEvent(stage, now - self._start, self.rows, max(allocated, 0)))
+        self._start_memory = self._reset_memory()
+        self._start = time.perf_counter()
+
+
+def stage_clock(rows):
+    """A clock for consecutive stages over rows rows; a no-op when profiling is off"""
+    return _NULL_CLOCK if _active is None else _StageClock(_active, rows)
+
+
+@contextmanager
+def stage(name, rows):
+    """Time the enclosed block as one stage over rows rows; a no-op when profiling is off"""
+    clock = stage_clock(rows)
+    yield
+    clock.lap(name)
+
+
+class Profiler:
+    """Collects per-stage wall time, row and allocation counters while active
+
+    Use as a context manager around generation; profilers nest, the
+    innermost one collects. hooks are called with every StageEvent, from
+    whichever thread finished the stage.
+    """
+
+    def __init__(self, hooks=(), trace_allocations=False):
+        self.hooks = list(hooks)
+        self.trace_allocations = trace_allocations
+        self.totals = {}
+        self.wall_seconds = 0.0
+        self._lock = threading.Lock()
+        self._previous = None
+        self._started_tracing = False
+        self._start = None
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        return hook
+
+    def record(self, event):
+        """Add one StageEvent to the totals and pass it to the hooks"""
+        with self._lock:
+            calls, seconds, rows, allocated, peak = self.totals.get(event.stage, (0, 0.0, 0, 0, 0))
+            self.totals[event.stage] = (calls + 1, seconds + event.seconds, rows + event.rows,
+                                        allocated + event.allocated_bytes, max(peak, event.allocated_bytes))
+        for hook in self.hooks:
+            hook(event)
+
+    def __enter__(self):
+        global _active
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._previous, _active = _active, self
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+        self.wall_seconds += time.perf_counter() - self._start
+        _active = self._previous
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    def stats(self):
+        """Per-stage totals as a DataFrame, slowest stage first"""
+        stats = pd.DataFrame.from_dict(self.totals, orient='index',
+                                       columns=['calls', 'seconds', 'rows', 'allocated_bytes', 'peak_bytes'])
+        stats.index.name = 'stage'
+        stats['rows_per_second'] = stats['rows'] / stats['seconds'].where(stats['seconds'] > 0)
+        return stats.sort_values('seconds', ascending=False, kind='stable')
+
+    def to_dict(self):
+        """JSON-serialisable totals"""
+        stages = {}
+        for name, (calls, seconds, rows, allocated, peak) in self.totals.items():
+            stages[name] = {'calls': calls, 'seconds': seconds, 'rows': rows,
+                            'allocated_bytes': allocated, 'peak_bytes': peak}
+        return {'wall_seconds': self.wall_seconds, 'trace_allocations': self.trace_allocations, 'stages': stages}
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix=PROMETHEUS_PREFIX):
+        """Totals in the Prometheus text exposition format"""
+        metrics = [
+            ('stage_calls_total', 'counter', 'Times each stage ran', 0),
+            ('stage_seconds_total', 'counter', 'Wall time spent in each stage', 1),
+            ('stage_rows_total', 'counter', 'Rows processed by each stage', 2),
+            ('stage_allocated_bytes_total', 'counter', 'Peak bytes allocated by each stage, summed over runs', 3),
+            ('stage_peak_bytes', 'gauge', 'Largest peak bytes allocated by one run of each stage', 4),
+        ]
+        lines = []
+        for name, kind, help_text, field in metrics:
+            if field >= 3 and not self.trace_allocations:
+                continue
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            for stage_name, values in self.totals.items():
+                lines.append(f'{prefix}_{name}{{stage="{stage_name}"}} {values[field]:g}')
+        lines.append(f'# HELP {prefix}_wall_seconds Wall time of the profiled run')
+        lines.append(f'# TYPE {prefix}_wall_seconds gauge')
+        lines.append(f'{prefix}_wall_seconds {self.wall_seconds:g}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Write the totals to path: Prometheus text for a .prom file, JSON otherwise"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus() if path.endswith('.prom') else self.to_json())
+
+    def report(self):
+        """Print a per-stage table"""
+        print(f"\n⏱️ Stage profile ({self.wall_seconds:.2f} s wall):")
+        stats = self.stats()
+        total = stats['seconds'].sum()
+        print(f"{'stage':<22}{'calls':>7}{'rows':>12}{'seconds':>10}{'share':>8}{'rows/s':>13}"
+              + (f"{'peak MB':>10}" if self.trace_allocations else ''))
+        for name, row in stats.iterrows():
+            share = row['seconds'] / total * 100 if total else 0
+            line = (f"{name:<22}{int(row['calls']):>7}{int(row['rows']):>12}{row['seconds']:>10.3f}"
+                    f"{share:>7.1f}%{row['rows_per_second']:>13,.0f}")
+            if self.trace_allocations:
+                line += f"{row['peak_bytes'] / 1e6:>10.1f}"
+            print(line)
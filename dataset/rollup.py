@@ -0,0 +1,248 @@
+"""Pre-aggregated rollup cube for the Power BI dashboard, built incrementally from chunks
+
+The cube holds, per cell of ROLLUP_DIMENSIONS, the row count and the sum of
+each ROLLUP_MEASURES column, plus a fixed-bin histogram sketch of every
+measure from which percentiles are estimated. Two tables are exported:
+
+- rollup: one row per cell with Rows, <measure>_Sum, <measure>_Mean and
+  <measure>_P50/_P90/_P99
+- rollup_sketch: (Cell_Id, Measure, Bin_Low, Bin_High, Count), so percentiles
+  can be recomputed for any coarser slice by summing bins
+
+Sketch bins are log-spaced for the positive measures and 1.25 dB wide for
+signal strength. An estimated percentile is the midpoint of the bin holding
+the cell's nearest-rank percentile (np.percentile with
+method='inverted_cdf'), so it is within half a bin of it:
+PERCENTILE_RELATIVE_ERROR (about +/-4.9%) for the positive measures and
++/-0.63 dB for signal strength. In cells with few rows, interpolated
+percentiles (numpy's default) can differ from the nearest-rank ones by far
+more than that.
+
+Sums are rounded to the precision the measures are generated with.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .profiling import stage
+from .schema import (CATEGORICAL_DIMENSIONS, TIME_DIMENSIONS, apply_compact_schema, dimension_codes,
+                     dimension_values)
+
+ROLLUP_DIMENSIONS = ['State', 'City', 'Carrier', 'Network_Type', 'Hour', 'Date']
+ROLLUP_MEASURES = ['Download_Speed_Mbps', 'Upload_Speed_Mbps', 'Latency_ms', 'Jitter_ms', 'Signal_Strength_dBm']
+ROLLUP_PERCENTILES = [50, 90, 99]
+# Decimals each measure is generated with
+MEASURE_DECIMALS = {'Download_Speed_Mbps': 2, 'Upload_Speed_Mbps': 2, 'Latency_ms': 1, 'Jitter_ms': 2,
+                    'Signal_Strength_dBm': 1}
+
+SKETCH_BINS = 128
+_LOG_EDGES = np.geomspace(0.1, 20000, SKETCH_BINS + 1)
+SKETCH_EDGES = {m: _LOG_EDGES for m in ROLLUP_MEASURES}
+SKETCH_EDGES['Signal_Strength_dBm'] = np.linspace(-160, 0, SKETCH_BINS + 1)
+# Bound on the relative error of a log-binned percentile: half a bin, in log space
+PERCENTILE_RELATIVE_ERROR = np.sqrt(_LOG_EDGES[1] / _LOG_EDGES[0]) - 1
+
+def _sum_by_key(keys, values):
+    """Collapse duplicate keys: sorted unique keys and the column sums of values for each"""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    summed = np.empty((len(unique), values.shape[1]))
+    for j in range(values.shape[1]):
+        summed[:, j] = np.bincount(inverse, weights=values[:, j], minlength=len(unique))
+    return unique, summed
+
+
+class _KeyedSums:
+    """Sparse int64 key -> float64 vector accumulator
+
+    New partial results are buffered and folded into the sorted main arrays
+    only once the buffer outgrows them, which keeps updates amortised O(rows).
+    """
+
+    def __init__(self, width):
+        self.keys = np.empty(0, dtype=np.int64)
+        self.values = np.empty((0, width))
+        self._pending = []
+        self._pending_rows = 0
+
+    def add(self, keys, values):
+        keys, values = _sum_by_key(keys, values)
+        self._pending.append((keys, values))
+        self._pending_rows += len(keys)
+        if self._pending_rows > max(len(self.keys), 1 << 16):
+            self.compact()
+
+    def merge(self, other):
+        other.compact()
+        self._pending.append((other.keys, other.values))
+        self._pending_rows += len(other.keys)
+        self.compact()
+
+    def compact(self):
+        if not self._pending:
+            return
+        keys = np.concatenate([self.keys] + [k for k, _ in self._pending])
+        values = np.concatenate([self.values] + [v for _, v in self._pending])
+        self.keys, self.values = _sum_by_key(keys, values)
+        self._pending = []
+        self._pending_rows = 0
+
+
+class RollupCube:
+    """Incrementally built rollup of the generated data over a set of dimensions
+
+    dimensions are names of categorical columns of the generated frame,
+    'Hour' (hour of day of Timestamp), 'Date' (calendar day of Timestamp) or
+    'Weekday' (0 = Monday). The number of exported rows is bounded by the
+    product of the dimension cardinalities, so coarser dimensions give a
+    smaller cube.
+    """
+
+    def __init__(self, dimensions=ROLLUP_DIMENSIONS, measures=ROLLUP_MEASURES):
+        allowed = CATEGORICAL_DIMENSIONS + TIME_DIMENSIONS
+        unknown = [d for d in dimensions if d not in allowed]
+        if unknown:
+            raise ValueError(f"unknown rollup dimensions {unknown}; choose from {', '.join(allowed)}")
+        self.dimensions = list(dimensions)
+        self.measures = list(measures)
+        self._radices = None
+        self._cells = _KeyedSums(1 + len(self.measures))
+        self._sketch = _KeyedSums(1)
+
+    def _cell_keys(self, chunk):
+        key = np.zeros(len(chunk), dtype=np.int64)
+        radices = []
+        for dimension in self.dimensions:
+            codes, radix = dimension_codes(chunk, dimension)
+            key = key * radix + codes
+            radices.append(radix)
+        if self._radices is None:
+            capacity = np.prod(np.array(radices, dtype=float)) * len(self.measures) * SKETCH_BINS
+            if capacity >= 2 ** 63:
+                raise ValueError(f"rollup dimensions {self.dimensions} have too many cells to key")
+            self._radices = radices
+        return key
+
+    def update(self, chunk):
+        """Fold one DataFrame chunk into the cube; returns self"""
+        if not all(isinstance(chunk[d].dtype, pd.CategoricalDtype)
+                   for d in self.dimensions if d not in TIME_DIMENSIONS):
+            chunk = apply_compact_schema(chunk)
+        if len(chunk) == 0:
+            return self
+        cells = self._cell_keys(chunk)
+
+        values = np.empty((len(chunk), 1 + len(self.measures)))
+        values[:, 0] = 1
+        sketch_keys = []
+        for j, measure in enumerate(self.measures):
+            # Widen without float32 noise, so the sums accumulate exact decimals
+            column = np.round(chunk[measure].to_numpy().astype(np.float64), MEASURE_DECIMALS.get(measure, 2))
+            values[:, j + 1] = column
+            bins = np.clip(np.searchsorted(SKETCH_EDGES[measure], column, side='right') - 1, 0, SKETCH_BINS - 1)
+            sketch_keys.append((cells * len(self.measures) + j) * SKETCH_BINS + bins)
+        self._cells.add(cells, values)
+        sketch_keys = np.concatenate(sketch_keys)
+        self._sketch.add(sketch_keys, np.ones((len(sketch_keys), 1)))
+        return self
+
+    def observe(self, chunks):
+        """Yield chunks unchanged while folding each into the cube"""
+        for chunk in chunks:
+            with stage('rollup', len(chunk)):
+                self.update(chunk)
+            yield chunk
+
+    def merge(self, other):
+        """Combine a cube built over another part of the data (same dimensions); returns self"""
+        if other.dimensions != self.dimensions or other.measures != self.measures:
+            raise ValueError("can only merge rollup cubes with the same dimensions and measures")
+        self._radices = self._radices or other._radices
+        self._cells.merge(other._cells)
+        self._sketch.merge(other._sketch)
+        return self
+
+    def _decode(self, keys):
+        """Split cell keys back into per-dimension code arrays"""
+        codes = {}
+        for dimension, radix in zip(reversed(self.dimensions), reversed(self._radices or [])):
+            keys, codes[dimension] = np.divmod(keys, radix)
+        return codes
+
+    def _percentiles(self, cell_keys):
+        """Estimated percentiles per (cell, measure) from the sketch: {(measure, q): array over cells}"""
+        self._sketch.compact()
+        keys, counts = self._sketch.keys, self._sketch.values[:, 0]
+        if not len(keys):
+            return {(m, q): np.full(len(cell_keys), np.nan) for m in self.measures for q in ROLLUP_PERCENTILES}
+        pair, bins = np.divmod(keys, SKETCH_BINS)
+        cells, measure_idx = np.divmod(pair, len(self.measures))
+        # Keys are sorted, so each (cell, measure) pair is one contiguous run of bins
+        starts = np.flatnonzero(np.r_[True, pair[1:] != pair[:-1]])
+        run = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(pair)]))
+        cumulative = np.cumsum(counts)
+        before = np.r_[0, cumulative][starts]
+        totals = np.add.reduceat(counts, starts)
+        fraction = (cumulative - before[run]) / totals[run]
+        cell_pos = np.searchsorted(cell_keys, cells[starts])
+
+        result = {}
+        for j, measure in enumerate(self.measures):
+            edges = SKETCH_EDGES[measure]
+            midpoints = (np.sqrt(edges[:-1] * edges[1:]) if edges[0] > 0 else (edges[:-1] + edges[1:]) / 2)
+            for q in ROLLUP_PERCENTILES:
+                hit = (fraction >= q / 100 - 1e-12) & (measure_idx == j)
+                first_runs, first_idx = np.unique(run[hit], return_index=True)
+                out = np.full(len(cell_keys), np.nan)
+                out[cell_pos[first_runs]] = midpoints[bins[hit][first_idx]]
+                result[(measure, q)] = out
+        return result
+
+    def to_frames(self):
+        """(rollup, rollup_sketch) DataFrames; see the module docstring for their layout"""
+        self._cells.compact()
+        keys, values = self._cells.keys, self._cells.values
+        codes = self._decode(keys)
+        rollup = pd.DataFrame({'Cell_Id': keys})
+        for dimension in self.dimensions:
+            rollup[dimension] = dimension_values(dimension, codes.get(dimension, np.zeros(0, np.int64)))
+        rows = values[:, 0]
+        rollup['Rows'] = rows.astype(np.int64)
+        percentiles = self._percentiles(keys)
+        for j, measure in enumerate(self.measures):
+            rollup[f'{measure}_Sum'] = np.round(values[:, j + 1], MEASURE_DECIMALS.get(measure, 2))
+            rollup[f'{measure}_Mean'] = (values[:, j + 1] / rows).astype(np.float32)
+            for q in ROLLUP_PERCENTILES:
+                rollup[f'{measure}_P{q}'] = percentiles[(measure, q)].astype(np.float32)
+
+        self._sketch.compact()
+        pair, bins = np.divmod(self._sketch.keys, SKETCH_BINS)
+        cells, measure_idx = np.divmod(pair, len(self.measures))
+        low = np.empty(len(bins), dtype=np.float32)
+        high = np.empty(len(bins), dtype=np.float32)
+        for j, measure in enumerate(self.measures):
+            mask = measure_idx == j
+            low[mask] = SKETCH_EDGES[measure][bins[mask]]
+            high[mask] = SKETCH_EDGES[measure][bins[mask] + 1]
+        sketch = pd.DataFrame({
+            'Cell_Id': cells,
+            'Measure': pd.Categorical.from_codes(measure_idx, categories=self.measures),
+            'Bin_Low': low,
+            'Bin_High': high,
+            'Count': self._sketch.values[:, 0].astype(np.int64),
+        })
+        return rollup, sketch
+
+    def write(self, directory, file_format='csv'):
+        """Write rollup.<ext> and rollup_sketch.<ext> into directory; returns the rollup row count"""
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"file_format must be 'csv' or 'parquet', got {file_format!r}")
+        os.makedirs(directory, exist_ok=True)
+        rollup, sketch = self.to_frames()
+        for name, frame in [('rollup', rollup), ('rollup_sketch', sketch)]:
+            path = os.path.join(directory, f'{name}.{file_format}')
+            if file_format == 'csv':
+                frame.to_csv(path, index=False)
+            else:
+                frame.to_parquet(path, index=False)
+        return len(rollup)
@@ -0,0 +1,109 @@
+"""Compact pandas dtypes for generated frames, and the integer coding of their dimensions"""
+import numpy as np
+import pandas as pd
+
+from .data import (CITY_NAMES, CONGESTION_LEVELS, INDIAN_BANDS, INDIAN_CARRIERS, INDIAN_DEVICES,
+                   INDOOR_OUTDOOR, NETWORK_TYPES, STATE_NAMES, VIDEO_QUALITIES)
+
+
+# Compact in-memory schema of a generated frame: categories for string
+# dimensions, the smallest integer type that fits, float32 measurements
+COMPACT_SCHEMA = {
+    'Timestamp': np.dtype('datetime64[us]'),
+    'City': pd.CategoricalDtype(CITY_NAMES),
+    'State': pd.CategoricalDtype(STATE_NAMES),
+    'City_Tier': np.dtype(np.int8),
+    'Signal_Strength_dBm': np.dtype(np.float32),
+    'Download_Speed_Mbps': np.dtype(np.float32),
+    'Upload_Speed_Mbps': np.dtype(np.float32),
+    'Latency_ms': np.dtype(np.float32),
+    'Jitter_ms': np.dtype(np.float32),
+    'Network_Type': pd.CategoricalDtype(NETWORK_TYPES),
+    'Device_Model': pd.CategoricalDtype(INDIAN_DEVICES),
+    'Carrier': pd.CategoricalDtype(INDIAN_CARRIERS),
+    'Band': pd.CategoricalDtype(INDIAN_BANDS),
+    'Battery_Level_%': np.dtype(np.int8),
+    'Temperature_C': np.dtype(np.float32),
+    'Connected_Duration_min': np.dtype(np.float32),
+    'Handover_Count': np.dtype(np.int16),
+    'Data_Usage_MB': np.dtype(np.float32),
+    'Video_Streaming_Quality': pd.CategoricalDtype(VIDEO_QUALITIES),
+    'VoLTE_Enabled': np.dtype(bool),
+    'Network_Congestion_Level': pd.CategoricalDtype(CONGESTION_LEVELS),
+    'Ping_to_Server_ms': np.dtype(np.float32),
+    'Packet_Loss_%': np.dtype(np.float32),
+    'Dropped_Connection': np.dtype(bool),
+    'Indoor_Outdoor': pd.CategoricalDtype(INDOOR_OUTDOOR),
+}
+
+
+def apply_compact_schema(df):
+    """Return df with every known column cast to its COMPACT_SCHEMA dtype"""
+    return df.astype({c: COMPACT_SCHEMA[c] for c in df.columns if c in COMPACT_SCHEMA})
+
+
+# Dimensions: the categorical columns plus these, derived from Timestamp
+CATEGORICAL_DIMENSIONS = [c for c, t in COMPACT_SCHEMA.items() if isinstance(t, pd.CategoricalDtype)]
+TIME_DIMENSIONS = ['Hour', 'Date', 'Weekday']
+
+# Dates are coded as days since this epoch; the radix covers a century
+DATE_EPOCH = np.datetime64('2000-01-01', 'D')
+DATE_RADIX = 36600
+
+
+def weekday_of_days(days):
+    """Weekday (0 = Monday) of day numbers counted from the Unix epoch"""
+    return (days + 3) % 7  # 1970-01-01 was a Thursday
+
+
+def dimension_codes(frame, dimension):
+    """Integer codes and radix of one dimension for every row of frame
+
+    Hour is the hour of day, Date the calendar day (coded from DATE_EPOCH)
+    and Weekday the day of week (0 = Monday) of Timestamp; a categorical
+    column is coded by its COMPACT_SCHEMA category codes.
+    """
+    if dimension == 'Hour':
+        hours = frame['Timestamp'].to_numpy().astype('datetime64[h]').astype(np.int64)
+        return hours % 24, 24
+    if dimension == 'Date':
+        days = (frame['Timestamp'].to_numpy().astype('datetime64[D]') - DATE_EPOCH).astype(np.int64)
+        if len(days) and (days.min() < 0 or days.max() >= DATE_RADIX):
+            last = DATE_EPOCH + np.timedelta64(DATE_RADIX - 1, 'D')
+            raise ValueError(f"the Date dimension covers {DATE_EPOCH} .. {last}; "
+                             f"got timestamps from {frame['Timestamp'].min()} to {frame['Timestamp'].max()}")
+        return days, DATE_RADIX
+    if dimension == 'Weekday':
+        return weekday_of_days(frame['Timestamp'].to_numpy().astype('datetime64[D]').astype(np.int64)), 7
+    return frame[dimension].cat.codes.to_numpy().astype(np.int64), len(COMPACT_SCHEMA[dimension].categories)
+
+
+def dimension_values(dimension, codes):
+    """Inverse of dimension_codes: the values of a dimension for its codes"""
+    if dimension in ('Hour', 'Weekday'):
+        return codes.astype(np.int8)
+    if dimension == 'Date':
+        return DATE_EPOCH + codes.astype('timedelta64[D]')
+    return pd.Categorical.from_codes(codes, dtype=COMPACT_SCHEMA[dimension])
+
+
+def _wide_dtype(dtype):
+    """The default pandas dtype a column would get from a list of record dicts"""
+    if isinstance(dtype, pd.CategoricalDtype) or dtype.kind in 'OU':
+        return np.dtype(object)
+    if dtype.kind in 'iu':
+        return np.dtype(np.int64)
+    if dtype.kind == 'f':
+        return np.dtype(np.float64)
+    return dtype
+
+
+def schema_memory_report(df):
+    """Per-column memory in bytes with default dtypes (before) and COMPACT_SCHEMA (after)"""
+    wide = df.astype({c: _wide_dtype(df[c].dtype) for c in df.columns})
+    before = wide.memory_usage(index=False, deep=True)
+    after = apply_compact_schema(df).memory_usage(index=False, deep=True)
+    report = pd.DataFrame({'before_bytes': before, 'after_bytes': after})
+    report.loc['Total'] = report.sum()
+    report['ratio'] = (report['before_bytes'] / report['after_bytes']).round(1)
+    return report
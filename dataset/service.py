@@ -0,0 +1,294 @@
+"""Local aggregate query service over a generated dataset
+
+The dataset is loaded once into compact columns (category codes and
+float32 measures). For every dimension an inverted index (row numbers
+grouped by level, CSR style) is precomputed, so a filter starts from the
+row list of its most selective level instead of scanning. Group-by
+aggregates are then np.bincount over the matching rows. Encoded responses
+are kept in an LRU cache keyed by the normalized query, so repeated
+dashboard queries are answered without touching the data.
+
+Serve it over HTTP or a Unix socket with ``python -m dataset.service``;
+a query looks like::
+
+    GET /aggregate?measure=Download_Speed_Mbps&agg=mean&by=Carrier&State=Kerala&Network_Type=5G
+
+Other query parameters named after a dimension filter on it
+(comma-separated values match any of them). /dimensions lists the
+dimensions with their levels and the measures; /health reports the row
+count and cache statistics.
+"""
+import argparse
+import json
+import os
+import socketserver
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from .schema import CATEGORICAL_DIMENSIONS, COMPACT_SCHEMA, apply_compact_schema, dimension_codes
+
+AGGREGATES = ['count', 'sum', 'mean', 'min', 'max']
+DEFAULT_CACHE_SIZE = 4096
+# Time dimensions served; Date is left out, its century-wide radix would make group keys sparse
+_TIME_DIMENSIONS = ['Hour', 'Weekday']
+
+
+class QueryError(ValueError):
+    """A query names an unknown measure, dimension, level or aggregate"""
+
+
+def load_dataset(path):
+    """Read a generated dataset from a CSV file, a Parquet directory/file or a column store"""
+    if os.path.isdir(path) and os.path.exists(os.path.join(path, 'header.json')):
+        from .colstore import open_column_store
+
+        return open_column_store(path)
+    if os.path.isdir(path) or path.endswith('.parquet'):
+        return apply_compact_schema(pd.read_parquet(path))
+    dtypes = {c: t for c, t in COMPACT_SCHEMA.items() if c != 'Timestamp'}
+    return pd.read_csv(path, dtype=dtypes, parse_dates=['Timestamp'])
+
+
+class AggregateIndex:
+    """Dataset columns plus per-dimension row indexes, answering filtered group-by aggregates"""
+
+    def __init__(self, frame, cache_size=DEFAULT_CACHE_SIZE):
+        frame = apply_compact_schema(frame)
+        self.rows = len(frame)
+        self.measures = {c: frame[c].to_numpy() for c, t in COMPACT_SCHEMA.items()
+                         if c in frame and not isinstance(t, pd.CategoricalDtype) and t.kind in 'if'}
+        self.codes = {}
+        self.levels = {}
+        self._order = {}
+        self._starts = {}
+        dimensions = [c for c in CATEGORICAL_DIMENSIONS if c in frame]
+        for dimension in dimensions + _TIME_DIMENSIONS:
+            codes, radix = dimension_codes(frame, dimension)
+            self.codes[dimension] = codes.astype(np.int32)
+            self.levels[dimension] = ([str(level) for level in range(radix)] if dimension in _TIME_DIMENSIONS
+                                      else list(COMPACT_SCHEMA[dimension].categories))
+            # Row numbers sorted by level; rows of level c are order[starts[c]:starts[c + 1]]
+            self._order[dimension] = np.argsort(codes, kind='stable').astype(np.int64)
+            self._starts[dimension] = np.r_[0, np.cumsum(np.bincount(codes, minlength=radix))]
+        self._level_codes = {d: {name: i for i, name in enumerate(levels)} for d, levels in self.levels.items()}
+        self.cached_query = lru_cache(maxsize=cache_size)(self._encoded_query)
+
+    def _level_rows(self, dimension, code):
+        order, starts = self._order[dimension], self._starts[dimension]
+        return order[starts[code]:starts[code + 1]]
+
+    def _filter_codes(self, filters):
+        """{dimension: sorted level codes} for a {dimension: level names} filter"""
+        resolved = {}
+        for dimension, values in filters.items():
+            if dimension not in self.codes:
+                raise QueryError(f"unknown dimension {dimension!r}")
+            codes = []
+            for value in values:
+                if value not in self._level_codes[dimension]:
+                    raise QueryError(f"unknown {dimension} {value!r}")
+                codes.append(self._level_codes[dimension][value])
+            resolved[dimension] = sorted(set(codes))
+        return resolved
+
+    def matching_rows(self, filters):
+        """Sorted row numbers matching every filter, or None for all rows"""
+        filters = self._filter_codes(filters)
+        if not filters:
+            return None
+        # Start from the dimension with the fewest candidate rows, then check the others per row
+        sizes = {d: sum(self._starts[d][c + 1] - self._starts[d][c] for c in codes) for d, codes in filters.items()}
+        first = min(sizes, key=sizes.get)
+        rows = np.sort(np.concatenate([self._level_rows(first, c) for c in filters[first]]))
+        for dimension, codes in filters.items():
+            if dimension != first and len(rows):
+                rows = rows[np.isin(self.codes[dimension][rows], codes)]
+        return rows
+
+    def query(self, measure='Download_Speed_Mbps', agg='mean', by=(), filters=None):
+        """Aggregate measure over the rows matching filters, grouped by the by dimensions
+
+        filters maps dimension names to lists of level names. Returns a
+        JSON-ready dict with one entry per non-empty group.
+        """
+        if measure not in self.measures:
+            raise QueryError(f"unknown measure {measure!r}")
+        if agg not in AGGREGATES:
+            raise QueryError(f"agg must be one of {AGGREGATES}, got {agg!r}")
+        by = list(by)
+        for dimension in by:
+            if dimension not in self.codes:
+                raise QueryError(f"unknown dimension {dimension!r}")
+        filters = filters or {}
+        rows = self.matching_rows(filters)
+
+        values = self.measures[measure]
+        key = np.zeros(self.rows if rows is None else len(rows), dtype=np.int64)
+        radices = []
+        for dimension in by:
+            codes = self.codes[dimension] if rows is None else self.codes[dimension][rows]
+            radix = len(self.levels[dimension])
+            key = key * radix + codes
+            radices.append(radix)
+        if rows is not None:
+            values = values[rows]
+        space = int(np.prod(radices))
+        if space <= max(len(key), 1 << 16):
+            # Small key space: the key itself indexes the cells, no sort needed
+            counts = np.bincount(key, minlength=space)
+            cells = np.flatnonzero(counts)
+            inverse = (np.cumsum(counts > 0) - 1)[key]
+            counts = counts[cells]
+        else:
+            cells, inverse = np.unique(key, return_inverse=True)
+            counts = np.bincount(inverse, minlength=len(cells))
+        if agg in ('sum', 'mean'):
+            result = np.bincount(inverse, weights=values, minlength=len(cells))
+            if agg == 'mean':
+                result = result / counts
+        elif agg in ('min', 'max'):
+            # Sort by group and reduce each run; much faster than ufunc.at over many rows
+            order = np.argsort(inverse, kind='stable')
+            starts = np.r_[0, np.cumsum(counts)[:-1]]
+            reduce = np.minimum if agg == 'min' else np.maximum
+            result = reduce.reduceat(values[order], starts) if len(cells) else np.empty(0)
+        else:
+            result = counts
+
+        groups = []
+        decoded = {}
+        remaining = cells
+        for dimension, radix in zip(reversed(by), reversed(radices)):
+            remaining, decoded[dimension] = np.divmod(remaining, radix)
+        for i in range(len(cells)):
+            group = {d: self.levels[d][decoded[d][i]] for d in by}
+            group['value'] = float(result[i])
+            group['count'] = int(counts[i])
+            groups.append(group)
+        return {'measure': measure, 'agg': agg, 'by': by, 'filters': filters,
+                'rows': int(counts.sum()), 'groups': groups}
+
+    def _encoded_query(self, measure, agg, by, filters):
+        return json.dumps(self.query(measure, agg, by, dict(filters))).encode('utf-8')
+
+    def query_json(self, measure='Download_Speed_Mbps', agg='mean', by=(), filters=None):
+        """query() encoded as JSON bytes, served from the LRU cache for repeated queries"""
+        key = tuple(sorted((d, tuple(sorted(set(v)))) for d, v in (filters or {}).items()))
+        return self.cached_query(measure, agg, tuple(by), key)
+
+    def describe(self):
+        return {'rows': self.rows, 'measures': list(self.measures), 'aggregates': AGGREGATES,
+                'dimensions': self.levels}
+
+
+def _parse_query(query_string):
+    """(measure, agg, by, filters) from a URL query string"""
+    params = parse_qs(query_string, keep_blank_values=True)
+    single = {}
+    for name in ('measure', 'agg', 'by'):
+        values = params.pop(name, [])
+        if len(values) > 1:
+            raise QueryError(f"{name} given more than once")
+        single[name] = values[0] if values else None
+    by = [d for d in (single['by'] or '').split(',') if d]
+    filters = {name: [v for value in values for v in value.split(',')] for name, values in params.items()}
+    return single['measure'] or 'Download_Speed_Mbps', single['agg'] or 'mean', by, filters
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, so repeated queries skip the TCP handshake
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't hold the body back
+    index = None
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            if url.path == '/aggregate':
+                measure, agg, by, filters = _parse_query(url.query)
+                body = self.index.query_json(measure, agg, by, filters)
+            elif url.path == '/dimensions':
+                body = json.dumps(self.index.describe()).encode('utf-8')
+            elif url.path == '/health':
+                info = self.index.cached_query.cache_info()
+                body = json.dumps({'rows': self.index.rows, 'cache_hits': info.hits, 'cache_misses': info.misses,
+                                   'cache_size': info.currsize}).encode('utf-8')
+            else:
+                self._send(404, json.dumps({'error': f'no such endpoint {url.path}'}).encode('utf-8'))
+                return
+        except QueryError as exc:
+            self._send(400, json.dumps({'error': str(exc)}).encode('utf-8'))
+            return
+        self._send(200, body)
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else 'unix-socket'
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        super().server_bind()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def make_server(index, host='127.0.0.1', port=8000, unix_socket=None):
+    """A threading HTTP server answering queries against index, on host:port or a Unix socket"""
+    handler = type('Handler', (_Handler,), {'index': index})
+    if unix_socket:
+        return _ThreadingUnixHTTPServer(unix_socket, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m dataset.service',
+                                     description='Serve filtered group-by aggregates over a generated dataset.')
+    parser.add_argument('-i', '--input', default='india_network_data.csv',
+                        help='CSV file, Parquet directory or column store to load (default: india_network_data.csv)')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='TCP port (default: 8000)')
+    parser.add_argument('--unix-socket', metavar='PATH', default=None, help='listen on a Unix socket instead')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'cached query results (default: {DEFAULT_CACHE_SIZE})')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    print(f"📂 Loading '{args.input}'...")
+    index = AggregateIndex(load_dataset(args.input), cache_size=args.cache_size)
+    server = make_server(index, args.host, args.port, args.unix_socket)
+    where = args.unix_socket or f'http://{args.host}:{args.port}'
+    print(f"🚀 Serving {index.rows} records on {where} (try /dimensions)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+"""Session mode: per-device trajectories simulated as batched Markov chains
+
+Each session is one device (fixed model, carrier and location) measured
+every interval_min minutes from a start time drawn from the traffic
+profile (sessions that would run past end_time are moved back to end by
+it). Network type, band and congestion level evolve as Markov chains:
+each interval a device keeps its state with a fixed probability and
+otherwise redraws it from the same distribution the per-row model uses, so
+the long-run mix of network types and congestion levels matches the
+independent-row dataset. Handover_Count accumulates band and network
+changes plus Poisson intra-band handovers, Connected_Duration_min is the
+time since the session started, battery drains, and a session ends early
+the first time its connection drops (more likely under congestion and on
+older networks).
+
+The simulation loops over measurement intervals only; every step updates
+all still-active devices with array operations, so a chunk can hold
+millions of concurrent devices. Rows carry a Session_Id and Step and are
+ordered by session, then step.
+"""
+import numpy as np
+import pandas as pd
+
+from .data import CARRIER_WEIGHTS, CONGESTION_PROBS, INDIAN_CARRIERS, INDIAN_DEVICES, INDIAN_LOCATIONS
+from .generator import (choice_per_row, compile_lookup_tables, cumulative_probs, generate_records,
+                        generate_timestamps)
+from .profiling import stage_clock
+
+DEFAULT_INTERVAL_MIN = 5
+DEFAULT_MEAN_STEPS = 12
+DEFAULT_MAX_STEPS = 48
+DEFAULT_SESSIONS_PER_CHUNK = 20_000
+
+# Per-interval probability of keeping the current state
+NETWORK_STICKINESS = 0.92
+BAND_STICKINESS = 0.95
+CONGESTION_STICKINESS = 0.85
+# Mean intra-band (same band, new cell) handovers per interval
+CELL_HANDOVER_RATE = 0.3
+# Per-interval drop probability: base x congestion level x network type (5G, 4G+, 4G, 3G, 2G)
+DROP_BASE_PROB = 0.006
+DROP_CONGESTION_FACTORS = np.array([1.0, 1.5, 3.0])
+DROP_NETWORK_FACTORS = np.array([1.0, 1.0, 1.2, 2.0, 3.0])
+# Download, upload and latency multipliers per congestion level (Low, Medium, High)
+CONGESTION_LOAD = np.array([[1.00, 1.00, 1.00],
+                            [0.85, 0.90, 1.15],
+                            [0.60, 0.70, 1.50]])
+# Battery drain in percentage points per interval
+BATTERY_DRAIN = (0.2, 1.2)
+
+# Extra leading columns of session-mode frames
+SESSION_COLUMNS = ['Session_Id', 'Step']
+
+
+def _markov_step(rng, state, stickiness, cdf, rows):
+    """Keep each state with probability stickiness, else redraw it from cdf[rows]; returns (state, changed)"""
+    redraw = rng.random(len(state)) >= stickiness
+    new_state = state.copy()
+    new_state[redraw] = choice_per_row(rng, cdf, rows[redraw])
+    return new_state, new_state != state
+
+
+def _simulate_sessions(num_sessions, rng, end_time, first_id=0, interval_min=DEFAULT_INTERVAL_MIN,
+                       mean_steps=DEFAULT_MEAN_STEPS, max_steps=DEFAULT_MAX_STEPS):
+    """Simulate num_sessions device sessions; returns a DataFrame with one row per measurement"""
+    tables = compile_lookup_tables()
+    congestion_cdf = cumulative_probs([CONGESTION_PROBS])
+    clock = stage_clock(num_sessions)
+
+    # Per-session constants
+    start = (generate_timestamps(rng, num_sessions, tables, end_time)
+             - rng.integers(0, 3600, num_sessions).astype('timedelta64[s]'))
+    loc_idx = rng.integers(0, len(INDIAN_LOCATIONS), num_sessions)
+    carrier_idx = rng.choice(len(INDIAN_CARRIERS), size=num_sessions, p=CARRIER_WEIGHTS)
+    device_idx = rng.integers(0, len(INDIAN_DEVICES), num_sessions)
+    planned_steps = np.minimum(rng.geometric(1 / mean_steps, num_sessions), max_steps)
+    # Move sessions that would run past end_time back, so every step stays in the year before it
+    last_step = start + ((planned_steps - 1) * interval_min).astype('timedelta64[m]')
+    start = start - np.maximum(last_step - end_time.to_datetime64(), np.timedelta64(0, 'us'))
+    bucket = tables.network_bucket[loc_idx]
+    no_rows = np.zeros(num_sessions, dtype=np.int64)
+
+    # Initial chain states, from the stationary (per-row) distributions
+    net = choice_per_row(rng, tables.network_type_cdf, bucket)
+    band = choice_per_row(rng, tables.band_cdf, net)
+    congestion = choice_per_row(rng, congestion_cdf, no_rows)
+    handovers = np.zeros(num_sessions, dtype=np.int64)
+    battery = rng.uniform(20, 100, num_sessions)
+    clock.lap('session_setup')
+
+    steps = []
+    active = np.arange(num_sessions)
+    for step in range(max_steps):
+        active = active[planned_steps[active] > step]
+        if not len(active):
+            break
+        if step:
+            net_now, net_changed = _markov_step(rng, net[active], NETWORK_STICKINESS,
+                                                tables.network_type_cdf, bucket[active])
+            # A new network type always means a new band; otherwise the band is its own chain
+            band_now, band_changed = _markov_step(rng, band[active], BAND_STICKINESS, tables.band_cdf, net_now)
+            forced = net_changed & ~band_changed
+            band_now[forced] = choice_per_row(rng, tables.band_cdf, net_now[forced])
+            band_changed |= forced
+            congestion[active], _ = _markov_step(rng, congestion[active], CONGESTION_STICKINESS,
+                                                 congestion_cdf, no_rows[active])
+            handovers[active] += net_changed | band_changed
+            handovers[active] += rng.poisson(CELL_HANDOVER_RATE, len(active))
+            battery[active] -= rng.uniform(*BATTERY_DRAIN, len(active))
+            net[active], band[active] = net_now, band_now
+
+        drop_prob = (DROP_BASE_PROB * DROP_CONGESTION_FACTORS[congestion[active]]
+                     * DROP_NETWORK_FACTORS[net[active]])
+        dropped = rng.random(len(active)) < drop_prob
+        steps.append((active, np.full(len(active), step), net[active], band[active], congestion[active],
+                      handovers[active], battery[active], dropped))
+        active = active[~dropped]
+    clock.lap('session_steps')
+
+    if steps:
+        session, step, net, band, congestion, handovers, battery, dropped = map(np.concatenate, zip(*steps))
+    else:
+        session = step = net = band = congestion = handovers = no_rows[:0]
+        battery, dropped = np.empty(0), np.zeros(0, dtype=bool)
+    order = np.argsort(session, kind='stable')  # steps were appended in time order
+    session, step, net, band, congestion = session[order], step[order], net[order], band[order], congestion[order]
+    handovers, battery, dropped = handovers[order], battery[order], dropped[order]
+
+    timestamps = (start[session] + (step * interval_min).astype('timedelta64[m]')).astype('datetime64[us]')
+    frame = generate_records(rng, tables, stage_clock(len(session)), timestamps, loc_idx[session], net,
+                             carrier_idx[session], device_idx=device_idx[session], band_idx=band,
+                             congestion_idx=congestion, load=CONGESTION_LOAD[congestion])
+    frame['Battery_Level_%'] = np.clip(np.round(battery), 1, 100).astype(np.int8)
+    frame['Connected_Duration_min'] = ((step + 1) * interval_min).astype(np.float32)
+    frame['Handover_Count'] = np.minimum(handovers, np.iinfo(np.int16).max).astype(np.int16)
+    frame['Dropped_Connection'] = dropped
+    frame.insert(0, SESSION_COLUMNS[1], step.astype(np.int16))
+    frame.insert(0, SESSION_COLUMNS[0], first_id + session)
+    return frame
+
+
+def iter_session_chunks(num_sessions, seed=None, sessions_per_chunk=DEFAULT_SESSIONS_PER_CHUNK, end_time=None,
+                        **options):
+    """Yield session-mode DataFrames, each simulating up to sessions_per_chunk devices
+
+    Session start times fall in the year before end_time (default: now);
+    each chunk draws from its own Generator spawned from seed, so for a
+    given seed, sessions_per_chunk and end_time the output is reproducible.
+    options (interval_min, mean_steps, max_steps) are passed to the simulation.
+    """
+    if sessions_per_chunk <= 0:
+        raise ValueError(f"sessions_per_chunk must be positive, got {sessions_per_chunk}")
+    end_time = pd.Timestamp.now() if end_time is None else pd.Timestamp(end_time)
+    num_chunks = -(-num_sessions // sessions_per_chunk)
+    for index, seed_seq in enumerate(np.random.SeedSequence(seed).spawn(num_chunks)):
+        first_id = index * sessions_per_chunk
+        n = min(sessions_per_chunk, num_sessions - first_id)
+        yield _simulate_sessions(n, np.random.default_rng(seed_seq), end_time, first_id, **options)
+
+
+def create_india_network_sessions(num_sessions=1000, seed=None, end_time=None, **options):
+    """Simulate num_sessions device sessions and return all their measurements as one DataFrame"""
+    rng = np.random.default_rng(seed)
+    end_time = pd.Timestamp.now() if end_time is None else pd.Timestamp(end_time)
+    return _simulate_sessions(num_sessions, rng, end_time, **options)
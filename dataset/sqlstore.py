@@ -0,0 +1,200 @@
+"""Bulk loader of generated chunks into an indexed SQLite (or DuckDB) database
+
+The string dimensions in DIMENSION_COLUMNS are normalized into small lookup
+tables (id, name) whose ids are the category codes of COMPACT_SCHEMA, so the
+fact table ``measurements`` stores integer foreign keys (<Column>_Id) that
+are taken straight from the chunk without a lookup. The remaining columns are
+stored as they are. Each chunk is inserted in one transaction with batched
+executemany (SQLite) or a single INSERT ... SELECT from the registered frame
+(DuckDB); the indexes are built once after the load, which is much cheaper
+than maintaining them row by row. The ``network_data`` view joins the
+dimensions back and has the column names of the CSV output.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .profiling import stage
+from .schema import COMPACT_SCHEMA, apply_compact_schema
+
+SQL_ENGINES = ['sqlite', 'duckdb']
+FACT_TABLE = 'measurements'
+VIEW_NAME = 'network_data'
+DIMENSION_COLUMNS = ['City', 'State', 'Network_Type', 'Device_Model', 'Carrier', 'Band']
+# name -> indexed columns, created after the load
+INDEXES = {
+    'idx_measurements_state_carrier_network': ['State', 'Carrier', 'Network_Type'],
+    'idx_measurements_timestamp': ['Timestamp'],
+}
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _fact_column(column):
+    """Column name in the fact table: dimensions are stored as <Column>_Id"""
+    return f'{column}_Id' if column in DIMENSION_COLUMNS else column
+
+
+def _sql_type(column, dtype, engine):
+    if column in DIMENSION_COLUMNS:
+        return 'INTEGER NOT NULL'
+    if isinstance(dtype, pd.CategoricalDtype):
+        return 'TEXT'
+    if dtype.kind == 'M':
+        # SQLite has no timestamp type; ISO 8601 text sorts and works with its date functions
+        return 'TEXT' if engine == 'sqlite' else 'TIMESTAMP'
+    if dtype.kind == 'b':
+        return 'BOOLEAN'
+    if dtype.kind in 'iu':
+        return 'INTEGER'
+    return 'DOUBLE'
+
+
+def schema_statements(engine='sqlite'):
+    """CREATE TABLE / VIEW statements of the normalized schema"""
+    statements = []
+    for column in DIMENSION_COLUMNS:
+        statements.append(f'CREATE TABLE {column.lower()} (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)')
+    fields = []
+    for column, dtype in COMPACT_SCHEMA.items():
+        field = f'{_quote(_fact_column(column))} {_sql_type(column, dtype, engine)}'
+        if column in DIMENSION_COLUMNS:
+            field += f' REFERENCES {column.lower()}(id)'
+        fields.append(field)
+    statements.append(f'CREATE TABLE {FACT_TABLE} ({", ".join(fields)})')
+
+    selected = []
+    for column in COMPACT_SCHEMA:
+        if column in DIMENSION_COLUMNS:
+            selected.append(f'{column.lower()}.name AS {_quote(column)}')
+        else:
+            selected.append(f'm.{_quote(column)}')
+    joins = ' '.join(f'JOIN {c.lower()} ON {c.lower()}.id = m.{_quote(_fact_column(c))}'
+                     for c in DIMENSION_COLUMNS)
+    statements.append(f'CREATE VIEW {VIEW_NAME} AS SELECT {", ".join(selected)} FROM {FACT_TABLE} m {joins}')
+    return statements
+
+
+def index_statements():
+    """CREATE INDEX statements, run once the data is loaded"""
+    return [f'CREATE INDEX {name} ON {FACT_TABLE} ({", ".join(_quote(_fact_column(c)) for c in columns)})'
+            for name, columns in INDEXES.items()]
+
+
+def _fact_frame(chunk, engine):
+    """The chunk with dimension columns replaced by their integer codes, in fact table order"""
+    if not all(isinstance(chunk[c].dtype, pd.CategoricalDtype) for c in DIMENSION_COLUMNS):
+        chunk = apply_compact_schema(chunk)
+    columns = {}
+    for column, dtype in COMPACT_SCHEMA.items():
+        values = chunk[column]
+        if column in DIMENSION_COLUMNS:
+            values = values.cat.codes.to_numpy().astype(np.int64)
+        elif isinstance(dtype, pd.CategoricalDtype):
+            values = values.astype(object).to_numpy()
+        elif dtype.kind == 'M' and engine == 'sqlite':
+            # pandas' own formatting, so the text is exactly what the CSV writer produces
+            values = values.astype(str).to_numpy()
+        elif dtype.kind == 'f':
+            # Widen without float32 noise: every measurement has at most two decimals
+            values = np.round(values.to_numpy().astype(np.float64), 2)
+        columns[_fact_column(column)] = values
+    return pd.DataFrame(columns)
+
+
+def _connect(path, engine):
+    if engine == 'sqlite':
+        import sqlite3
+
+        connection = sqlite3.connect(path, isolation_level=None)
+        # The load goes into a temporary file that is deleted on failure, so trade durability for speed
+        connection.execute('PRAGMA journal_mode = OFF')
+        connection.execute('PRAGMA synchronous = OFF')
+        return connection
+    try:
+        import duckdb
+    except ImportError as exc:
+        raise ImportError("DuckDB output requires duckdb (pip install duckdb)") from exc
+    return duckdb.connect(path)
+
+
+def _insert_sqlite(connection, frame, batch_size):
+    placeholders = ', '.join('?' * frame.shape[1])
+    statement = f'INSERT INTO {FACT_TABLE} VALUES ({placeholders})'
+    for start in range(0, len(frame), batch_size):
+        batch = frame.iloc[start:start + batch_size]
+        connection.executemany(statement, zip(*(batch[c].tolist() for c in batch.columns)))
+
+
+# Files a database may leave next to its main file
+_SIDECAR_SUFFIXES = ['-journal', '-wal', '-shm', '.wal']
+
+
+def _remove_database(path):
+    for stale in [path] + [path + suffix for suffix in _SIDECAR_SUFFIXES]:
+        if os.path.exists(stale):
+            os.remove(stale)
+
+
+def write_sql_chunks(chunks, path, engine='sqlite', batch_size=DEFAULT_BATCH_SIZE, overwrite=False):
+    """Bulk-load DataFrame chunks into a new SQLite or DuckDB database file; returns rows written
+
+    See the module docstring for the schema. Each chunk is loaded in its
+    own transaction in batches of batch_size rows (SQLite); indexes are
+    created and statistics gathered after the last chunk. The database is
+    built in a temporary file that replaces path only once the load is
+    complete, so a failed load leaves no partial database behind.
+    """
+    if engine not in SQL_ENGINES:
+        raise ValueError(f"engine must be one of {SQL_ENGINES}, got {engine!r}")
+    if os.path.exists(path) and not overwrite:
+        raise FileExistsError(f"{path} already exists; pass overwrite=True to replace it")
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    _remove_database(tmp_path)
+    try:
+        written = _load(chunks, tmp_path, engine, batch_size)
+        _remove_database(path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_database(tmp_path)
+        raise
+    return written
+
+
+def _load(chunks, path, engine, batch_size):
+    connection = _connect(path, engine)
+    written = 0
+    try:
+        connection.execute('BEGIN')
+        for statement in schema_statements(engine):
+            connection.execute(statement)
+        for column in DIMENSION_COLUMNS:
+            names = list(COMPACT_SCHEMA[column].categories)
+            connection.executemany(f'INSERT INTO {column.lower()} VALUES (?, ?)', list(enumerate(names)))
+        connection.execute('COMMIT')
+
+        for chunk in chunks:
+            with stage('sql_insert', len(chunk)):
+                frame = _fact_frame(chunk, engine)
+                connection.execute('BEGIN')
+                if engine == 'sqlite':
+                    _insert_sqlite(connection, frame, batch_size)
+                else:
+                    connection.register('chunk_frame', frame)
+                    connection.execute(f'INSERT INTO {FACT_TABLE} SELECT * FROM chunk_frame')
+                    connection.unregister('chunk_frame')
+                connection.execute('COMMIT')
+            written += len(chunk)
+
+        with stage('sql_index', written):
+            for statement in index_statements():
+                connection.execute(statement)
+            connection.execute('ANALYZE')
+    finally:
+        connection.close()
+    return written
@@ -0,0 +1,163 @@
+"""Console summary of a generated dataset, computed incrementally over chunks"""
+import numpy as np
+import pandas as pd
+
+from .profiling import stage
+from .schema import COMPACT_SCHEMA, apply_compact_schema
+
+# Columns whose running sum, min and max are tracked
+MEASURE_COLUMNS = ['Download_Speed_Mbps', 'Upload_Speed_Mbps', 'Latency_ms', 'Temperature_C', 'Signal_Strength_dBm']
+# Categorical columns whose per-level counts are tracked
+COUNT_COLUMNS = ['City', 'State', 'Device_Model', 'Network_Type', 'Carrier', 'Band']
+# (group column, value column) pairs whose per-group sums are tracked
+GROUP_MEANS = [('City', 'Download_Speed_Mbps'), ('State', 'Download_Speed_Mbps')]
+
+
+class StreamingSummary:
+    """Running statistics over generated chunks, updated in one pass per chunk
+
+    Keeps row count, sum/min/max of MEASURE_COLUMNS, per-level counts of
+    COUNT_COLUMNS and per-group sums for GROUP_MEANS. Everything is a fixed
+    size array indexed by category code, so memory does not grow with the
+    data. Partial summaries from parallel shards combine with merge().
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sums = dict.fromkeys(MEASURE_COLUMNS, 0.0)
+        self.mins = dict.fromkeys(MEASURE_COLUMNS, np.inf)
+        self.maxs = dict.fromkeys(MEASURE_COLUMNS, -np.inf)
+        self.level_counts = {c: np.zeros(len(COMPACT_SCHEMA[c].categories), dtype=np.int64)
+                             for c in COUNT_COLUMNS}
+        self.group_sums = {g: np.zeros(len(COMPACT_SCHEMA[g[0]].categories)) for g in GROUP_MEANS}
+
+    def update(self, chunk):
+        """Fold one DataFrame chunk into the running statistics; returns self"""
+        if not all(isinstance(chunk[c].dtype, pd.CategoricalDtype) for c in COUNT_COLUMNS):
+            chunk = apply_compact_schema(chunk)
+        if len(chunk) == 0:
+            return self
+        self.count += len(chunk)
+        for column in MEASURE_COLUMNS:
+            values = chunk[column].to_numpy()
+            self.sums[column] += values.sum(dtype=np.float64)
+            self.mins[column] = min(self.mins[column], values.min())
+            self.maxs[column] = max(self.maxs[column], values.max())
+        codes = {c: chunk[c].cat.codes.to_numpy() for c in COUNT_COLUMNS}
+        for column, counts in self.level_counts.items():
+            counts += np.bincount(codes[column], minlength=len(counts))
+        for (group, value), sums in self.group_sums.items():
+            sums += np.bincount(codes[group], weights=chunk[value].to_numpy(), minlength=len(sums))
+        return self
+
+    def observe(self, chunks):
+        """Yield chunks unchanged while folding each into the summary"""
+        for chunk in chunks:
+            with stage('summary', len(chunk)):
+                self.update(chunk)
+            yield chunk
+
+    def merge(self, other):
+        """Combine another partial summary (e.g. from another shard) into this one; returns self"""
+        self.count += other.count
+        for column in MEASURE_COLUMNS:
+            self.sums[column] += other.sums[column]
+            self.mins[column] = min(self.mins[column], other.mins[column])
+            self.maxs[column] = max(self.maxs[column], other.maxs[column])
+        for column, counts in self.level_counts.items():
+            counts += other.level_counts[column]
+        for key, sums in self.group_sums.items():
+            sums += other.group_sums[key]
+        return self
+
+    def mean(self, column):
+        return self.sums[column] / self.count if self.count else float('nan')
+
+    def counts(self, column):
+        """Per-level counts as a Series, most common first, unseen levels dropped"""
+        counts = pd.Series(self.level_counts[column], index=COMPACT_SCHEMA[column].categories)
+        return counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+    def group_means(self, group, value):
+        """Mean of value per level of group, highest first, unseen levels dropped"""
+        counts = self.level_counts[group]
+        seen = counts > 0
+        means = pd.Series(self.group_sums[(group, value)][seen] / counts[seen],
+                          index=COMPACT_SCHEMA[group].categories[seen])
+        return means.sort_values(ascending=False, kind='stable')
+
+    def top(self, column, k=10):
+        return self.counts(column).head(k)
+
+
+def _compact_row_bytes():
+    """Bytes per row of a frame in COMPACT_SCHEMA (category codes counted at their code width)"""
+    total = 0
+    for dtype in COMPACT_SCHEMA.values():
+        if isinstance(dtype, pd.CategoricalDtype):
+            total += pd.Categorical.from_codes([], dtype=dtype).codes.itemsize
+        else:
+            total += dtype.itemsize
+    return total
+
+
+def _measure(value, unit, count):
+    """One decimal plus unit, or n/a when no records were seen"""
+    return f"{value:.1f}{unit}" if count else 'n/a'
+
+
+def print_summary(summary):
+    """Print coverage, performance and distribution statistics
+
+    summary is a StreamingSummary, or a DataFrame which is summarised first.
+    """
+    if isinstance(summary, pd.DataFrame):
+        summary = StreamingSummary().update(summary)
+    n = summary.count
+    percent = 100 / n if n else 0.0  # share of the records, in %
+
+    print(f"📊 Total records: {n}")
+    print(f"🏙️ Cities covered: {len(summary.counts('City'))}")
+    print(f"🗺️ States/UTs covered: {len(summary.counts('State'))}")
+    print(f"📱 Device models: {len(summary.counts('Device_Model'))}")
+    print(f"📶 Network types: {', '.join(summary.counts('Network_Type').index)}")
+    print(f"🏢 Carriers: {', '.join(summary.counts('Carrier').index)}")
+    print(f"📡 Frequency bands: {len(summary.counts('Band'))}")
+    print(f"💾 In-memory size: {n * _compact_row_bytes() / 1e6:.1f} MB (compact schema)")
+    print("\n📈 Performance Metrics:")
+    print(f"📥 Average Download Speed: {_measure(summary.mean('Download_Speed_Mbps'), ' Mbps', n)}")
+    print(f"📤 Average Upload Speed: {_measure(summary.mean('Upload_Speed_Mbps'), ' Mbps', n)}")
+    print(f"⏱️ Average Latency: {_measure(summary.mean('Latency_ms'), ' ms', n)}")
+    print("\n📊 Network Distribution:")
+    network_counts = summary.counts('Network_Type')
+    for network_type in COMPACT_SCHEMA['Network_Type'].categories:
+        print(f"{network_type} Adoption: {network_counts.get(network_type, 0) * percent:.1f}%")
+    print("\n🎯 Top 10 Cities by Average Download Speed:")
+    top_cities = summary.group_means('City', 'Download_Speed_Mbps').head(10)
+    for idx, (city, speed) in enumerate(top_cities.items(), 1):
+        print(f"{idx}. {city}: {speed:.1f} Mbps")
+
+    print("\n🗺️ Top 10 States by Average Download Speed:")
+    top_states = summary.group_means('State', 'Download_Speed_Mbps').head(10)
+    for idx, (state, speed) in enumerate(top_states.items(), 1):
+        print(f"{idx}. {state}: {speed:.1f} Mbps")
+
+    print("\n📱 Top 10 Most Common Devices:")
+    top_devices = summary.top('Device_Model', 10)
+    for idx, (device, count) in enumerate(top_devices.items(), 1):
+        print(f"{idx}. {device}: {count} records")
+
+    print("\n🏢 Carrier Distribution:")
+    carrier_dist = summary.counts('Carrier')
+    for carrier, count in carrier_dist.items():
+        print(f"{carrier}: {count} records ({count * percent:.1f}%)")
+
+    print("\n🌡️ Temperature Statistics:")
+    print(f"Average: {_measure(summary.mean('Temperature_C'), '°C', n)}")
+    print(f"Min: {_measure(summary.mins['Temperature_C'], '°C', n)}")
+    print(f"Max: {_measure(summary.maxs['Temperature_C'], '°C', n)}")
+
+    print("\n📶 Signal Strength Statistics:")
+    print(f"Average: {_measure(summary.mean('Signal_Strength_dBm'), ' dBm', n)}")
+    print(f"Min: {_measure(summary.mins['Signal_Strength_dBm'], ' dBm', n)}")
+    print(f"Max: {_measure(summary.maxs['Signal_Strength_dBm'], ' dBm', n)}")
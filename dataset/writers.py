@@ -0,0 +1,178 @@
+"""CSV and columnar (Parquet / Feather) writers for generated chunks"""
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .generator import DEFAULT_CHUNK_SIZE, iter_india_network_chunks
+from .pipeline import ordered_map, prefetch_chunks
+from .profiling import stage
+from .schema import COMPACT_SCHEMA
+
+
+CSV_COMPRESSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+def _csv_compression(path, compression):
+    """Resolve compression='infer' from the file extension (.gz / .zst)"""
+    if compression == 'infer':
+        return CSV_COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+    if compression not in (None, *CSV_COMPRESSIONS.values()):
+        raise ValueError(f"CSV compression must be None, 'gzip' or 'zstd', got {compression!r}")
+    return compression
+
+
+def _compressor(compression):
+    """bytes -> bytes function producing one self-contained gzip member or zstd frame
+
+    Both formats allow members/frames to be concatenated, so chunks can be
+    compressed independently (and in parallel) and simply appended.
+    """
+    if compression is None:
+        return lambda data: data
+    if compression == 'gzip':
+        import zlib
+
+        # wbits=31 writes the gzip header and trailer
+        return lambda data: zlib.compress(data, 6, wbits=31)
+    pa, _ = _require_pyarrow()
+    codec = pa.Codec('zstd', compression_level=3)
+    return lambda data: codec.compress(data, asbytes=True)
+
+
+def write_csv_chunks(chunks, path, compression='infer', threads=1, columns=None):
+    """Append an iterable of DataFrame chunks to one CSV file; returns the row count written
+
+    compression is None, 'gzip', 'zstd' or 'infer' (from a .gz / .zst
+    extension). With threads > 1 chunks are encoded and compressed on a
+    thread pool while earlier ones are written, in their original order.
+    If there are no chunks, only a header of columns (default: the
+    COMPACT_SCHEMA columns) is written.
+    """
+    compress = _compressor(_csv_compression(path, compression))
+    written = 0
+
+    def encode(item):
+        first, chunk = item
+        with stage('csv_encode', len(chunk)):
+            return len(chunk), compress(chunk.to_csv(header=first, index=False, lineterminator='\n').encode('utf-8'))
+
+    numbered = ((i == 0, chunk) for i, chunk in enumerate(chunks))
+    with open(path, 'wb') as f:
+        for rows, data in ordered_map(encode, numbered, threads):
+            with stage('csv_write', rows):
+                f.write(data)
+            written += rows
+        if not f.tell():
+            empty = pd.DataFrame(columns=list(COMPACT_SCHEMA) if columns is None else columns)
+            f.write(compress(empty.to_csv(index=False, lineterminator='\n').encode('utf-8')))
+    return written
+
+
+def write_india_network_csv(path, num_records, chunk_size=DEFAULT_CHUNK_SIZE, seed=None, compression='infer',
+                            threads=1):
+    """Stream num_records rows to a CSV file chunk by chunk; returns the row count written
+
+    Generation runs one chunk ahead on a background thread while the
+    previous chunk is encoded, compressed and written.
+    """
+    chunks = prefetch_chunks(iter_india_network_chunks(num_records, chunk_size, seed))
+    return write_csv_chunks(chunks, path, compression, threads)
+
+
+DEFAULT_PARTITION_BY = ('State', 'Month')
+
+
+def _require_pyarrow():
+    """Import pyarrow lazily; it is only needed for the columnar writers"""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+    except ImportError as exc:
+        raise ImportError("Parquet/Feather output requires pyarrow (pip install pyarrow)") from exc
+    return pa, ds
+
+
+def arrow_schema():
+    """Arrow schema of a generated chunk: dictionary-encoded dimensions, typed timestamps, plus Month"""
+    pa, _ = _require_pyarrow()
+    fields = []
+    for column, dtype in COMPACT_SCHEMA.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            fields.append((column, pa.dictionary(pa.int32(), pa.string())))
+        elif dtype.kind == 'M':
+            fields.append((column, pa.timestamp('us')))
+        else:
+            fields.append((column, pa.from_numpy_dtype(dtype)))
+    fields.append(('Month', pa.string()))
+    return pa.schema(fields)
+
+
+def _to_arrow(chunk, schema):
+    """Convert a generated chunk to an Arrow table, adding the Month partition key"""
+    pa, _ = _require_pyarrow()
+    months, codes = np.unique(chunk['Timestamp'].to_numpy().astype('datetime64[M]'), return_inverse=True)
+    chunk = chunk.assign(Month=months.astype(str).astype(object)[codes])
+    return pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+
+def write_columnar_chunks(chunks, root_path, file_format='parquet', compression='zstd',
+                          partition_by=DEFAULT_PARTITION_BY, min_rows_per_group=16_384, overwrite=False):
+    """Stream DataFrame chunks into a hive-partitioned Parquet or Feather dataset; returns rows written
+
+    Chunks are streamed into one file per partition (default: State and
+    month of Timestamp), so readers can prune partitions. compression is any
+    codec pyarrow supports for the format (Feather: 'zstd', 'lz4' or None).
+    Rows are buffered per partition until min_rows_per_group is reached, so
+    worst-case memory is roughly partitions x min_rows_per_group rows.
+    """
+    pa, ds = _require_pyarrow()
+    if file_format == 'parquet':
+        fmt = ds.ParquetFileFormat()
+    elif file_format == 'feather':
+        fmt = ds.IpcFileFormat()
+    else:
+        raise ValueError(f"file_format must be 'parquet' or 'feather', got {file_format!r}")
+
+    if os.path.exists(root_path) and os.listdir(root_path):
+        if not overwrite:
+            raise FileExistsError(f"{root_path} is not empty; pass overwrite=True to replace it")
+        shutil.rmtree(root_path)
+
+    schema = arrow_schema()
+    partitioning = None
+    if partition_by:
+        # Partition keys are written as directory names, so they are plain strings
+        for column in partition_by:
+            schema = schema.set(schema.get_field_index(column), schema.field(column).with_type(pa.string()))
+        partitioning = ds.partitioning(pa.schema([schema.field(c) for c in partition_by]), flavor='hive')
+
+    written = 0
+
+    def batches():
+        nonlocal written
+        for chunk in chunks:
+            with stage('arrow_convert', len(chunk)):
+                table = _to_arrow(chunk, schema).combine_chunks()
+            yield from table.to_batches()
+            written += len(chunk)
+
+    # One streaming write keeps a file open per partition across chunks
+    ds.write_dataset(batches(), root_path, schema=schema, format=fmt,
+                     file_options=fmt.make_write_options(compression=compression),
+                     partitioning=partitioning, basename_template=f'part-{{i}}.{file_format}',
+                     min_rows_per_group=min_rows_per_group, max_rows_per_group=max(min_rows_per_group, 1 << 20),
+                     existing_data_behavior='overwrite_or_ignore')
+    return written
+
+
+def write_india_network_columnar(root_path, num_records, chunk_size=DEFAULT_CHUNK_SIZE, seed=None, **options):
+    """Generate num_records rows straight into a partitioned Parquet/Feather dataset
+
+    Generation runs one chunk ahead on a background thread; Arrow encodes and
+    compresses on its own thread pool. options are passed to write_columnar_chunks (file_format, compression,
+    partition_by, min_rows_per_group, overwrite).
+    """
+    chunks = prefetch_chunks(iter_india_network_chunks(num_records, chunk_size, seed))
+    return write_columnar_chunks(chunks, root_path, **options)
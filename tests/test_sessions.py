@@ -0,0 +1,16 @@
+import pandas as pd
+
+from dataset.sessions import create_india_network_sessions, iter_session_chunks
+
+
+def test_session_timestamps_stay_in_the_year_before_end_time():
+    end_time = pd.Timestamp('2026-01-01')
+    for chunk in iter_session_chunks(40_000, seed=0, end_time=end_time):
+        assert chunk['Timestamp'].max() <= end_time
+        assert chunk['Timestamp'].min() > end_time - pd.Timedelta(days=365)
+
+
+def test_session_steps_are_consecutive_intervals():
+    frame = create_india_network_sessions(2000, seed=1, end_time='2026-01-01')
+    steps = frame.groupby('Session_Id')['Timestamp'].diff().dropna()
+    assert (steps == pd.Timedelta(minutes=5)).all()
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataset.sketches import CountMinSketch, KLLSketch
+
+
+def test_count_min_estimates_integer_keys():
+    sketch = CountMinSketch().update([5, 5, 5, 7])
+    assert list(sketch.estimate([5, 7])) == [3, 1]
+
+
+def test_count_min_never_undercounts():
+    values = np.random.default_rng(0).integers(0, 5000, 100_000)
+    sketch = CountMinSketch(width=256).update(values)
+    keys, counts = np.unique(values, return_counts=True)
+    assert (sketch.estimate(keys) >= counts).all()
+
+
+def test_count_min_estimates_categorical_column_by_name():
+    column = pd.Series(['Jio', 'Airtel', 'Jio'], dtype=pd.CategoricalDtype(['Jio', 'Airtel', 'BSNL']))
+    sketch = CountMinSketch().update(column)
+    assert list(sketch.estimate(['Jio', 'Airtel', 'BSNL'])) == [2, 1, 0]
+
+
+def test_kll_merge_rejects_different_k():
+    with pytest.raises(ValueError):
+        KLLSketch(k=200).merge(KLLSketch(k=100))